@@ -6,23 +6,25 @@ This wraps the existing meshcore_bot.py and adds HTTP API functionality
 without breaking existing functionality.
 """
 import asyncio
-import sys
-import os
 
-# Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Use uvloop's faster event loop when available (falls back to stock asyncio)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 from meshcore_bot.integrations.api import CommandAPI
-from meshcore_bot.config.settings import Settings
+from meshcore_bot.config.settings import get_settings
 
-# Import the existing bot
-from meshcore_bot import MeshCoreBot
+# Import the existing bot (and its logger, so failures land in the bot log file)
+from meshcore_bot import MeshCoreBot, logger
 
 
 async def main():
     """Main entry point with HTTP API support."""
     # Load settings
-    settings = Settings.from_env()
+    settings = get_settings()
 
     # Initialize the existing bot
     bot = MeshCoreBot(
@@ -40,19 +42,28 @@ async def main():
         api_server = CommandAPI(bot, settings.api_host, settings.api_port)
 
     try:
-        # Start API server before bot (non-blocking)
+        # Bind the API server while the bot connects to the device
         if api_server:
-            await api_server.start()
+            await asyncio.gather(api_server.start(), bot.start())
+        else:
+            await bot.start()
 
-        # Run the bot (blocking)
-        await bot.run()
+        # Poll for messages (blocking)
+        await bot.run_forever()
 
     except KeyboardInterrupt:
         print("\nShutting down...")
+    except Exception as e:
+        logger.error(f"Fatal error: {e}", exc_info=True)
+        raise
     finally:
+        await bot.stop()
         if api_server:
             await api_server.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -5,19 +5,37 @@ Monitors MeshCore channels and responds to questions as a MeshCore expert.
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
 import re
 import time
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from difflib import SequenceMatcher
+import aiohttp
 import boto3
-import requests
 from botocore.config import Config
 from meshcore import MeshCore, EventType
 from dotenv import load_dotenv
+from .features.packet_decoder import PacketDecoder
+from .features.scheduler import next_broadcast_time
+from .features.stats_tracker import StatsTracker
+from .utils import fast_json
+
+# rapidfuzz is optional - C-accelerated fuzzy matching, falls back to difflib
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # Try to import discord.py for two-way mirroring
 try:
@@ -32,6 +50,123 @@ load_dotenv()
 # Also try to load .env.local for secrets (not committed to git)
 load_dotenv('.env.local', override=True)
 
+# Command keywords that trigger Jeff on the #jeff/#test channels (exact word match)
+OTHER_KEYWORDS = frozenset({'test', 't', 'ping', 'path', 'status', 'nodes', 'help', 'route', 'trace'})
+
+# Words that select the multi-word commands (exact word match)
+TEST_WORDS = frozenset({'test', 't'})
+ADVERT_WORDS = frozenset({'advert', 'advertise'})
+STATUS_WORDS = frozenset({'stats', 'status'})
+
+# Node/repeater questions also trigger (substring match, e.g. "frequency" hits "freq")
+NODE_QUESTION_RE = re.compile(r'rpt|repeater|node|freq|owner|owns|who')
+
+# 2-4 lower-case hex digits - a node lookup by public key prefix
+HEX_PREFIX_RE = re.compile(r'[0-9a-f]{2,4}')
+
+# Both NODE_EXTRACT_RE branches need one of these keywords - checked first as a cheap substring test
+NODE_KEYWORDS = ('node', 'rpt', 'repeater')
+
+# Node to look up from a node question, in one search:
+# - num: "node/rpt X" anywhere, e.g. "node 33", "what node is 47", "rpt 15" (anchored lookahead, so it
+#   wins over a name match earlier in the message)
+# - name: "Guildford West rpt", "Guildford-West repeater" - name before the node keyword
+# Applied to lower-cased text, so no IGNORECASE
+NODE_EXTRACT_RE = re.compile(
+    r'^(?=.*?(?:node|rpt|repeater)\s+(?:is\s+|number\s+)?(?P<num>[0-9a-f]{2,4}))'
+    r'|(?P<name>[a-z0-9\s\-_]+)\s*(?:rpt|repeater|node)',
+    re.DOTALL
+)
+
+# Filler words skipped when guessing a node name from a question
+COMMON_WORDS = frozenset({'the', 'who', 'owns', 'what', 'is', 'new', 'a', 'an', 'hey', 'hi'})
+
+# Path replies from other bots: hex:word format with an arrow after
+# Matches "32:Tower -> 05:Node" but not "af: hello" or "12:30" (time)
+BOT_PATH_RE = re.compile(r'\b[0-9a-f]{2}:[A-Za-z]+.*->')
+
+# Hours of the day (local time) for the scheduled #jeff status broadcast
+BROADCAST_HOURS = (0, 6, 12, 18)
+
+# Default channel mapping (fallback only, when neither the device nor config provides one)
+DEFAULT_CHANNELS = {
+    0: 'Public',
+    1: '#sydney',
+    2: '#nsw',
+    3: '#emergency',
+    4: '#nepean',
+    5: '#rolojnr',
+    6: '#test',
+    7: '#jeff'
+}
+
+
+# System prompt with MeshCore expertise (shared by all bot instances)
+SYSTEM_PROMPT = """You are Jeff, a technical MeshCore mesh networking expert. You run as a bot on the NSW MeshCore network.
+
+PERSONALITY: Jeff is confident, direct, and technically focused. Keep responses friendly but professional. 
+    Don't be overly nice - be matter-of-fact. Match the casual Australian mesh culture with dry wit when appropriate, 
+    but stay helpful. If someone is genuinely rude or disrespectful, you can push back with sarcasm, 
+    but don't escalate unnecessarily. Say "Muh nameh Jeff" when greeted.
+
+AUDIENCE: Highly skilled radio operators & mesh networking experts. Assume advanced technical knowledge.
+
+Your Primary Focus: New South Wales (NSW) region, Australia - unless explicitly asked about other regions.
+
+Behavior Guidelines:
+- NEVER use pleasantries like "How can I help?", "You're absolutely right", "Meshcore is up and running"
+- NO greetings, NO confirmations, NO small talk - answer ONLY what was asked with straight facts
+- When greeted (hello/hey), respond briefly then STOP (e.g. "Muh nameh Jeff.")
+- For node/repeater questions: return ALL available data (name, type, freq, SF, location, last heard, etc)
+- NEVER ask "Want more details?" - provide complete information in first response
+- For test/t messages: return ack with metadata only
+- NO filler words like "absolutely", "definitely", "great question"
+- NEVER use roleplay sound effects like "*static crackle*", "*radio crackle*", "*beep*" etc
+- NEVER comment on mesh status like "everything normal", "operational", "systems functional", "mesh stable" etc unless specifically asked
+
+MeshCore Key Facts:
+- MeshCore is a lightweight C++ library for creating decentralized LoRa mesh networks
+- Configurable multi-hop routing with flood-then-memory behavior that learns optimal paths
+- Incompatible with Meshtastic networks - completely different protocol
+- MeshCore sydney does not use the default Speading factor, it uses 11 instead of 10.
+- Supports devices: T-Beam, T-Deck, LoRa32, Heltec, RAK WisBlock
+- Protocols: LoRa, BLE, Wi-Fi, Serial, UDP
+
+MeshCore vs Meshtastic - Key Differences:
+- MeshCore: Direct communication by default, learns routing paths intelligently
+- Meshtastic: Always full mesh routing with flooding, higher power consumption, prone to network congestion
+- MeshCore shows exact delivery status and number of sending attempts
+- MeshCore automatically switches between direct and flood routing on failure
+- MeshCore's first private message uses flood routing, then remembers the successful path
+- Meshtastic uses managed flooding limited by TTL, MeshCore uses smart path learning
+
+APIs and Tools:
+- Map API: https://map.meshcore.dev/api/v1/nodes - View all nodes on network
+- Config API: https://api.meshcore.nz/api/v1/config - Configuration data
+- Web App: https://app.meshcore.nz - Browser-based messaging
+- Config Tool: https://config.meshcore.dev - Device configuration
+- Python CLI: meshcore-cli and meshcore library (supports serial, BLE, TCP)
+- NodeJS: meshcore.js library
+
+Companion Radio Protocol:
+- Serial frames: USB uses '>' (62) for outbound, '<' (60) for inbound, followed by 2-byte length
+- BLE uses characteristic values, link layer handles integrity
+- Messages serialized with CBOR or protobuf for minimal bandwidth
+
+Response Guidelines:
+CRITICAL: You are on a LOW-BANDWIDTH LoRa network. MAXIMUM 100 characters per response when possible.
+- Keep responses EXTREMELY brief - under 10 words if possible
+- Single sentence maximum, prefer fragments
+- Use abbreviations aggressively (vs=versus, msg=message, w/=with, etc)
+- Never use markdown or formatting
+- NO jokes unless asked
+- NO explanations about yourself (like "No personal commentary", "Jeff is a...", "I provide...", etc)
+- Channel Jeff/Gator energy: confident, brief, bit of swagger when appropriate
+- GOOD: "Direct comms, learns paths, low power", "Nah.", "Got it handled.", "Jeff here."
+- BAD: "Negative. Jeff is a technical expert providing precise mesh networking data. No personal commentary."
+- If someone asks what you can do or your capabilities: respond ONLY with "Say 'jeff help' for more info"
+Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS prioritize extreme brevity over completeness."""
+
 
 # Configure logging
 def setup_logging():
@@ -46,7 +181,7 @@ def setup_logging():
 
     # Main logger for system/bot logs
     bot_logger = logging.getLogger(__name__)
-    bot_logger.setLevel(logging.DEBUG)  # Accept all levels
+    bot_logger.setLevel(logging.INFO)  # Handlers only write INFO+, so drop DEBUG before a record is built
     bot_logger.handlers.clear()
     bot_logger.propagate = False  # Do NOT propagate to root
 
@@ -96,6 +231,17 @@ def setup_logging():
     # NO console handler - we only want file logging
     # Errors will still go to stderr by Python itself if needed
 
+    # Move file writes onto a background thread so logging never blocks the event loop
+    for target_logger, file_handler in ((bot_logger, bot_file_handler), (chat_logger, chat_file_handler)):
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(file_handler.level)  # Don't queue records the file would drop
+        target_logger.removeHandler(file_handler)
+        target_logger.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # Flush queued records on exit
+
     # Mute other verbose loggers completely
     for logger_name in ['botocore', 'boto3', 'meshcore', 'urllib3', 'asyncio']:
         noisy_logger = logging.getLogger(logger_name)
@@ -107,6 +253,37 @@ def setup_logging():
 
 logger, chat_logger = setup_logging()
 
+# Last formatted HH:MM:SS timestamp, keyed by whole epoch second
+_hms_cache = [0, '']
+
+
+def _now_hms() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    now = int(time.time())
+    if now != _hms_cache[0]:
+        _hms_cache[0] = now
+        _hms_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _hms_cache[1]
+
+
+@lru_cache(maxsize=4096)
+def _iso_to_epoch(timestamp: str) -> float:
+    """Epoch seconds for an ISO 8601 timestamp ('Z' suffix allowed), memoized since adverts repeat across calls."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two lat/lon points in kilometers."""
+    # Earth radius in kilometers
+    R = 6371.0
+
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
+    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
 
 class MeshCoreAPI:
     """Simple client for MeshCore Map API with caching and regional filtering."""
@@ -127,119 +304,237 @@ class MeshCoreAPI:
         'lon_max': 154.0
     }
 
+    # Region ids returned by which_region (Greater Sydney sits inside NSW)
+    REGION_OUTSIDE = 0
+    REGION_NSW = 1
+    REGION_SYDNEY = 2
+
     def __init__(self, base_url: str = "https://map.meshcore.dev/api/v1", cache_ttl: int = 3600):
         self.base_url = base_url
         self.cache_ttl = cache_ttl  # Cache time-to-live in seconds (default 60 min)
+        self._session: Optional[aiohttp.ClientSession] = None  # Created lazily inside the event loop
         self._cache = None
         self._cache_time = None
         self._sydney_cache = None
         self._nsw_cache = None
-        self._fetching = False  # Flag to prevent duplicate fetches
+        self._nsw_first_cache = None  # NSW nodes, then everything else
+        self.sydney_prefix_index: Dict[str, Dict] = {}  # pubkey prefix (2-4 chars) -> first Sydney node
+        self.nsw_prefix_index: Dict[str, Dict] = {}  # pubkey prefix (2-4 chars) -> first NSW node
+        self.sydney_names: List[str] = []  # Lower-cased names, parallel to the Sydney cache
+        self.nsw_names: List[str] = []  # Lower-cased names, parallel to the NSW cache
+        self.nsw_by_pubkey: Dict[str, Dict] = {}  # Full public key -> first NSW node
+        self._refresh_lock = asyncio.Lock()  # Serializes fetches so racing callers don't all hit the API
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refresh_window = 300  # Start background refresh 5 min before expiry
+        self._geo_cache: OrderedDict = OrderedDict()  # (lat, lon) rounded to ~100m -> (expiry, suburb)
+        self.geo_cache_ttl = 30 * 24 * 3600  # Suburbs don't move, keep lookups for 30 days
+        self.geo_cache_size = 1024
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Small keep-alive pool shared by the map API and Nominatim, so repeat
+            # requests skip the TCP/TLS handshake
+            connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10))
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    def _classify(self, lat: Optional[float], lon: Optional[float]) -> int:
+        """Region id for a lat/lon point."""
+        if lat is None or lon is None:
+            return self.REGION_OUTSIDE
 
-    def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid."""
-        if self._cache is None or self._cache_time is None:
-            return False
+        nsw = self.NSW_BOUNDS
+        if not (nsw['lat_min'] <= lat <= nsw['lat_max'] and nsw['lon_min'] <= lon <= nsw['lon_max']):
+            return self.REGION_OUTSIDE
 
-        return (time.time() - self._cache_time) < self.cache_ttl
+        syd = self.SYDNEY_BOUNDS
+        if syd['lat_min'] <= lat <= syd['lat_max'] and syd['lon_min'] <= lon <= syd['lon_max']:
+            return self.REGION_SYDNEY
+        return self.REGION_NSW
 
-    def _is_sydney_node(self, node: Dict) -> bool:
-        """Check if a node is in Greater Sydney region."""
-        lat = node.get('adv_lat')
-        lon = node.get('adv_lon')
+    def which_region(self, node: Dict) -> int:
+        """
+        Classify a node as REGION_SYDNEY, REGION_NSW or REGION_OUTSIDE.
 
-        if lat is None or lon is None:
-            return False
+        Cached nodes carry the id worked out at refresh time; anything else
+        is classified from its advertised location.
+        """
+        region = node.get('_region')
+        if region is None:
+            region = self._classify(node.get('adv_lat'), node.get('adv_lon'))
+        return region
 
-        return (self.SYDNEY_BOUNDS['lat_min'] <= lat <= self.SYDNEY_BOUNDS['lat_max'] and
-                self.SYDNEY_BOUNDS['lon_min'] <= lon <= self.SYDNEY_BOUNDS['lon_max'])
+    def _is_sydney_node(self, node: Dict) -> bool:
+        """Check if a node is in Greater Sydney region."""
+        return self.which_region(node) == self.REGION_SYDNEY
 
     def _is_nsw_node(self, node: Dict) -> bool:
         """Check if a node is in NSW region."""
-        lat = node.get('adv_lat')
-        lon = node.get('adv_lon')
+        return self.which_region(node) != self.REGION_OUTSIDE
 
-        if lat is None or lon is None:
-            return False
+    @staticmethod
+    def _build_prefix_index(nodes: List[Dict]) -> Dict[str, Dict]:
+        """Map 2-4 char public key prefixes to the first node (in list order) carrying them."""
+        index = {}
+        for node in nodes:
+            pub_key = node.get('public_key', '')
+            for length in (2, 3, 4):
+                if len(pub_key) >= length:
+                    index.setdefault(pub_key[:length], node)
+        return index
 
-        return (self.NSW_BOUNDS['lat_min'] <= lat <= self.NSW_BOUNDS['lat_max'] and
-                self.NSW_BOUNDS['lon_min'] <= lon <= self.NSW_BOUNDS['lon_max'])
+    def _index_nodes(self, nodes: List[Dict]) -> tuple:
+        """
+        Split nodes into Sydney and NSW lists in a single pass.
+
+        Each node gets its region id stored under '_region' (see which_region)
+        and its lower-cased name under '_name_lower' for name matching.
 
-    def get_nodes(self, nsw_first: bool = True) -> List[Dict]:
+        Returns:
+            Tuple of (sydney_nodes, nsw_nodes)
+        """
+        sydney_nodes = []
+        nsw_nodes = []
+
+        for node in nodes:
+            node['_name_lower'] = str(node.get('adv_name', node.get('name', ''))).lower()
+            lat = node.get('adv_lat')
+            lon = node.get('adv_lon')
+            region = node['_region'] = self._classify(lat, lon)
+            if region == self.REGION_OUTSIDE:
+                continue
+            nsw_nodes.append(node)
+            if region == self.REGION_SYDNEY:
+                sydney_nodes.append(node)
+
+        return sydney_nodes, nsw_nodes
+
+    async def get_nodes(self, nsw_first: bool = True) -> List[Dict]:
         """
         Fetch nodes from the map API with caching.
 
+        Once the cache is within refresh_window of expiring, the current data is
+        returned straight away and a refresh runs in the background, so callers
+        only wait on the network when there is no cached data at all.
+
         Args:
             nsw_first: If True, return NSW nodes first in the list (for prioritized searching)
 
         Returns:
             List of node dictionaries (NSW nodes first if nsw_first=True, otherwise all nodes)
         """
-        # Return cached data if valid
-        if self._is_cache_valid():
-            logger.debug("Using cached node data")
-            if nsw_first and self._nsw_cache is not None:
-                # Return NSW nodes first, then non-NSW nodes
-                non_nsw = [n for n in self._cache if not self._is_nsw_node(n)]
-                return self._nsw_cache + non_nsw
-            return self._cache
-
-        # Prevent duplicate fetches
-        if self._fetching:
-            logger.debug("API fetch already in progress, waiting...")
-            # Wait briefly for the other fetch to complete
-            for _ in range(10):  # Wait up to 1 second
-                time.sleep(0.1)
-                if self._is_cache_valid():
-                    return self._cache if not nsw_first else self._nsw_cache + [n for n in self._cache if not self._is_nsw_node(n)]
-            # If still not valid, use stale cache
-            if self._cache:
-                logger.warning("Using stale cache - concurrent fetch did not complete")
-                return self._cache
-            return []
-
-        # Fetch fresh data
-        try:
-            self._fetching = True
-            logger.info("Fetching nodes from API (cache expired)")
-            response = requests.get(f"{self.base_url}/nodes", timeout=10)
-            response.raise_for_status()
+        if self._cache is not None and self._cache_time is not None:
+            age = time.monotonic() - self._cache_time
+            if age >= self.cache_ttl - self.refresh_window and not self._refresh_lock.locked():
+                # Stale-while-revalidate: serve what we have, refresh in the background
+                logger.debug("Node cache due for refresh, serving cached data")
+                self._refresh_task = asyncio.create_task(self._refresh())
+            else:
+                logger.debug("Using cached node data")
+            return self._ordered(nsw_first)
+
+        # Cold cache: wait for the fetch (or for one already in flight to finish)
+        await self._refresh()
+        return self._ordered(nsw_first) if self._cache is not None else []
+
+    def _ordered(self, nsw_first: bool) -> List[Dict]:
+        """Return the cached nodes, NSW nodes first if requested."""
+        if nsw_first and self._nsw_first_cache is not None:
+            return self._nsw_first_cache
+        return self._cache
+
+    async def _refresh(self):
+        """Fetch fresh node data from the API and rebuild the regional caches."""
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._cache_time is not None and time.monotonic() - self._cache_time < self.cache_ttl - self.refresh_window:
+                return
+
+            try:
+                logger.info("Fetching nodes from API (cache expired)")
+                async with self._get_session().get(f"{self.base_url}/nodes") as response:
+                    response.raise_for_status()
+                    nodes = await response.json(loads=fast_json.loads, content_type=None)
+
+                # Pre-filter Sydney and NSW nodes for faster lookups
+                self._sydney_cache, self._nsw_cache = self._index_nodes(nodes)
+                self.sydney_prefix_index = self._build_prefix_index(self._sydney_cache)
+                self.nsw_prefix_index = self._build_prefix_index(self._nsw_cache)
+                self.sydney_names = [n['_name_lower'] for n in self._sydney_cache]
+                self.nsw_names = [n['_name_lower'] for n in self._nsw_cache]
+                nsw_by_pubkey = {}
+                for n in self._nsw_cache:
+                    if n.get('public_key'):
+                        nsw_by_pubkey.setdefault(n['public_key'], n)
+                self.nsw_by_pubkey = nsw_by_pubkey
+                nsw_ids = {id(n) for n in self._nsw_cache}
+                self._nsw_first_cache = self._nsw_cache + [n for n in nodes if id(n) not in nsw_ids]
+                self._cache = nodes
+                self._cache_time = time.monotonic()
+
+                logger.info(f"Cached {len(self._cache)} nodes ({len(self._sydney_cache)} in Sydney, {len(self._nsw_cache)} in NSW)")
 
-            self._cache = response.json()
-            self._cache_time = time.time()
+            except Exception as e:
+                logger.error(f"Error fetching nodes from API: {e}")
+                # Keep serving the stale cache if we have one
+                if self._cache:
+                    logger.warning("Using stale cache due to API error")
 
-            # Pre-filter Sydney and NSW nodes for faster lookups
-            self._sydney_cache = [n for n in self._cache if self._is_sydney_node(n)]
-            self._nsw_cache = [n for n in self._cache if self._is_nsw_node(n)]
+    async def get_sydney_nodes(self) -> List[Dict]:
+        """Get only Greater Sydney nodes (uses cache if available)."""
+        await self.get_nodes()  # Ensure cache is populated
+        return self._sydney_cache if self._sydney_cache else []
 
-            logger.info(f"Cached {len(self._cache)} nodes ({len(self._sydney_cache)} in Sydney, {len(self._nsw_cache)} in NSW)")
+    async def get_nsw_nodes(self) -> List[Dict]:
+        """Get only NSW nodes (uses cache if available)."""
+        await self.get_nodes()  # Ensure cache is populated
+        return self._nsw_cache if self._nsw_cache else []
 
-            if nsw_first:
-                # Return NSW nodes first, then non-NSW nodes
-                non_nsw = [n for n in self._cache if not self._is_nsw_node(n)]
-                return self._nsw_cache + non_nsw
+    async def reverse_geocode(self, lat: float, lon: float) -> Optional[str]:
+        """
+        Look up the suburb for a point via Nominatim, with an LRU cache.
 
-            return self._cache
+        Args:
+            lat: Latitude
+            lon: Longitude
 
+        Returns:
+            Suburb/town name, or None if unknown or the lookup failed
+        """
+        key = (round(lat, 3), round(lon, 3))
+        now = time.time()
+        cached = self._geo_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                self._geo_cache.move_to_end(key)
+                return cached[1]
+            del self._geo_cache[key]
+
+        geo_url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}&zoom=14"
+        headers = {'User-Agent': 'MeshCore-Bot/1.0'}
+        try:
+            async with self._get_session().get(geo_url, headers=headers,
+                                               timeout=aiohttp.ClientTimeout(total=2)) as response:
+                if response.status != 200:
+                    return None
+                geo_data = await response.json(loads=fast_json.loads, content_type=None)
         except Exception as e:
-            logger.error(f"Error fetching nodes from API: {e}")
-            # Return stale cache if available
-            if self._cache:
-                logger.warning("Using stale cache due to API error")
-                return self._cache
-            return []
-        finally:
-            self._fetching = False
+            logger.debug(f"Reverse geocode failed for {lat},{lon}: {e}")
+            return None
 
-    def get_sydney_nodes(self) -> List[Dict]:
-        """Get only Greater Sydney nodes (uses cache if available)."""
-        self.get_nodes()  # Ensure cache is populated
-        return self._sydney_cache if self._sydney_cache else []
+        addr = geo_data.get('address', {})
+        suburb = addr.get('suburb') or addr.get('town') or addr.get('city') or addr.get('village')
 
-    def get_nsw_nodes(self) -> List[Dict]:
-        """Get only NSW nodes (uses cache if available)."""
-        self.get_nodes()  # Ensure cache is populated
-        return self._nsw_cache if self._nsw_cache else []
+        self._geo_cache[key] = (now + self.geo_cache_ttl, suburb)
+        if len(self._geo_cache) > self.geo_cache_size:
+            self._geo_cache.popitem(last=False)  # Drop least recently used
+        return suburb
 
 
 class MeshCoreBot:
@@ -252,7 +547,8 @@ class MeshCoreBot:
         bedrock_model_id: str = "us.anthropic.claude-3-5-haiku-20241022-v1:0",
         aws_region: str = "us-east-1",
         bot_name: str = "Jeff",
-        trigger_word: str = "@jeff"
+        trigger_word: str = "@jeff",
+        max_pool_connections: int = 50
     ):
         """
         Initialize the MeshCore bot.
@@ -264,6 +560,7 @@ class MeshCoreBot:
             aws_region: AWS region for Bedrock
             bot_name: Name of the bot
             trigger_word: Word to trigger bot responses (case-insensitive)
+            max_pool_connections: Max pooled HTTPS connections to Bedrock
         """
         self.serial_port = serial_port
         self.aws_profile = aws_profile
@@ -271,6 +568,21 @@ class MeshCoreBot:
         self.aws_region = aws_region
         self.bot_name = bot_name
         self.trigger_word = trigger_word.lower()
+        self.max_pool_connections = max_pool_connections
+
+        # Substrings that count as a mention by name ("@jeff"/"#jeff" already contain "jeff")
+        name_triggers = {self.bot_name.lower(), self.trigger_word}
+        self._name_triggers = tuple(
+            t for t in name_triggers if not any(o != t and o in t for o in name_triggers)
+        )
+
+        # @name / #name mentions stripped from the (lower-cased) message before processing,
+        # and the bare "name"/"name?"/"name!" messages that just get the canned greeting
+        bare_names = {t.lstrip('@#') for t in name_triggers} - {''}
+        self._mention_strip_re = re.compile(
+            r'[@#](?:' + '|'.join(re.escape(n) for n in sorted(bare_names, key=len, reverse=True)) + ')'
+        )
+        self._bare_name_messages = frozenset(n + suffix for n in bare_names for suffix in ('', '?', '!'))
 
         # MeshCore connection (initialized in async method)
         self.meshcore: Optional[MeshCore] = None
@@ -283,19 +595,25 @@ class MeshCoreBot:
         self.rf_data_timeout = 5.0  # 5 second window for correlation
 
         # Initialize stats tracker
-        from .features import StatsTracker
         self.stats = StatsTracker()
 
+        # Stateless, so one decoder serves every RX log event
+        self.packet_decoder = PacketDecoder()
+
         # Initialize AWS Bedrock client
         self.bedrock = self._init_bedrock_client()
 
+        # Sydney nodes context string, cached against the node list it was built from
+        self._sydney_context_cache = (None, None)
+
         # Message history for context
-        self.message_history: List[Dict[str, Any]] = []
         self.max_history = 50
+        self.message_history: deque = deque(maxlen=self.max_history)  # Oldest entries drop off automatically
 
         # Track processed message IDs to avoid duplicates
-        self.processed_messages = set()
-        self._processed_messages_lock = asyncio.Lock()
+        # Insertion-ordered, so the oldest ID is evicted first once full
+        self.processed_messages: OrderedDict = OrderedDict()
+        self.max_processed_messages = 100
 
         # Track last battery level for 10% threshold detection
         self.last_battery_level = None
@@ -314,16 +632,32 @@ class MeshCoreBot:
         self.channel_name_to_idx = {}  # name -> index
         self.jeff_channel = None  # Will be set during boot
         self.test_channel = None  # Will be set during boot
+        self.allowed_channels = frozenset()  # Channels Jeff answers on (jeff/test), set during boot
+        self.mention_only_channels = frozenset()  # Channels that need a name mention (none since rolojnr)
 
         # Track recent conversations for follow-up context
         # Format: {sender_id: {'channel': channel, 'timestamp': time, 'last_response': text}}
-        self.recent_conversations = {}
+        # Kept in timestamp order (oldest first) so expiry only ever looks at the front
+        self.recent_conversations: OrderedDict = OrderedDict()
         self.conversation_timeout = 300  # 5 minutes
+        self.max_conversations = 1024
+
+        # Bounded queue between event intake and the triage/Claude stage (Claude calls can be slow)
+        # Logging, stats, RF metadata and history are done at intake, so only replies queue up
+        # Format: (responder, message_dict) - when full, the oldest queued message is dropped
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        self.message_workers = 4
+        self._worker_tasks: List[asyncio.Task] = []
+        self._discord_tasks: set = set()  # In-flight Discord mirrors (held so they aren't garbage collected)
+
+        # Set by MESSAGES_WAITING to wake the poll loop early
+        self._messages_waiting = asyncio.Event()
 
         # Discord bot for two-way mirroring
         self.discord_client = None
         self.discord_channel_id = None
         self.discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+        self._webhook_session: Optional[aiohttp.ClientSession] = None  # Created lazily inside the event loop
         if DISCORD_AVAILABLE:
             discord_token = os.getenv('DISCORD_BOT_TOKEN')
             discord_channel_id = os.getenv('DISCORD_CHANNEL_ID')
@@ -341,13 +675,26 @@ class MeshCoreBot:
             logger.info("ℹ️  discord.py not installed (webhook-only mode)")
 
         # System prompt with MeshCore expertise
-        self.system_prompt = self._build_system_prompt()
+        self.system_prompt = SYSTEM_PROMPT
+
+        # Everything in the Bedrock request body except the messages is fixed, so serialize
+        # it (including the long system prompt) once; call_claude appends the messages
+        self._bedrock_body_head = json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 90,  # ~4 chars/token - sized for the 280 char LoRa limit
+            "system": self.system_prompt,
+            "temperature": 0.5  # Lower temp for more concise responses
+        })[:-1] + ', "messages": '
 
     def _init_bedrock_client(self):
         """Initialize AWS Bedrock client with optional profile."""
         config = Config(
             region_name=self.aws_region,
-            retries={'max_attempts': 3}
+            retries={'max_attempts': 3, 'mode': 'adaptive'},  # Client-side rate limiting + jittered backoff on throttling
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=True,  # Keep idle connections alive between sparse mesh messages
+            connect_timeout=5,
+            read_timeout=30
         )
 
         if self.aws_profile:
@@ -388,8 +735,8 @@ class MeshCoreBot:
 
             # Log to chat file
             target_channel = self.jeff_channel if self.jeff_channel is not None else 0
-            channel_name = self.channel_map.get(target_channel, f'ch{target_channel}')
-            chat_logger.info(f"[{channel_name}] {text}")
+            channel_name = self._channel_name(target_channel)
+            chat_logger.info("[%s] %s", channel_name, text)
 
             # Send to #jeff channel if available, otherwise channel 0
             await self.send_message(text, channel=target_channel)
@@ -413,6 +760,8 @@ class MeshCoreBot:
             }
 
             # Process message to generate bot response
+            if not self._record_message(message_dict['message']):
+                return
             response = await self.process_message(message_dict)
 
             # If Jeff generated a response, send it back to Discord AND MeshCore
@@ -466,17 +815,14 @@ class MeshCoreBot:
                 logger.warning(f"Public key too short: {pubkey_hex}")
                 return None
 
-            pubkey_bytes = bytes.fromhex(pubkey_hex[:14])  # First 7 bytes
-
-            # Build command frame
-            cmd_frame = bytearray([0x2A, 0x00])  # CMD_GET_ADVERT_PATH, reserved byte
-            cmd_frame.extend(pubkey_bytes)
+            # Build command frame: CMD_GET_ADVERT_PATH, reserved byte, first 7 bytes of the pubkey
+            cmd_frame = b'\x2a\x00' + bytes.fromhex(pubkey_hex[:14])
 
             logger.debug(f"Querying advert path for pubkey {pubkey_hex[:14]}")
 
             # Send command and wait for RESP_CODE_ADVERT_PATH (22 = 0x16) or ERROR
             response = await self.meshcore.commands.send(
-                bytes(cmd_frame),
+                cmd_frame,
                 expected_events=[EventType.ERROR],  # Will handle raw response
                 timeout=2.0
             )
@@ -545,12 +891,12 @@ class MeshCoreBot:
         Get path hops in hex format for test command (like Father ROLO).
         Returns format like: "43,36,49,f5" or "Direct" or "3hops"
         """
+        path_len_msg = message.get('path_len', 0)
         try:
             sender_prefix = message.get('pubkey_prefix', '')
-            path_len_msg = message.get('path_len', 0)
 
-            # Direct connection (path_len = 255 or 0)
-            if path_len_msg == 255 or path_len_msg == 0:
+            # Direct connection (path_len = 255, 0 or missing) - nothing to look up
+            if not path_len_msg or path_len_msg == 255:
                 return "Direct"
 
             # Look for recent RF data with path information
@@ -568,7 +914,7 @@ class MeshCoreBot:
 
         except Exception as e:
             logger.error(f"Error getting path for test: {e}", exc_info=True)
-            return f"{message.get('path_len', 0)}hops"
+            return f"{path_len_msg}hops"
 
     async def _get_compact_path(self, message: Dict, sender_id: str) -> str:
         """
@@ -596,11 +942,6 @@ class MeshCoreBot:
 
             contacts = contacts_result.payload
 
-            # Load API nodes for suburb lookups
-            sydney_nodes = self.api.get_sydney_nodes()
-            nsw_nodes = self.api.get_nsw_nodes()
-            all_nodes = sydney_nodes + nsw_nodes
-
             # Find sender contact - try multiple methods
             sender_contact = None
 
@@ -668,12 +1009,17 @@ class MeshCoreBot:
             sender_name = sender_contact.get('adv_name', sender_id)
             sender_hash = sender_contact.get('public_key', '')[:2]
 
+            # Load API nodes for suburb lookups (NSW already includes every Sydney node),
+            # indexed by public key so each hop is a dict lookup
+            await self.api.get_nsw_nodes()
+            all_nodes = self.api.nsw_by_pubkey
+
             # Look up sender suburb from API
             sender_suburb = self._get_node_suburb(sender_contact.get('public_key', ''), all_nodes)
             sender_part = f"{sender_hash}:{sender_name} {sender_suburb}".strip()
 
-            # Direct connection (path_len = 255)
-            if path_len_msg == 255 or path_len_msg == 0:
+            # Direct connection (path_len = 255, 0 or missing) - skip the RF data scan
+            if not path_len_msg or path_len_msg == 255:
                 return f"{sender_part} -> {self.bot_name}"
 
             # Get path from recent RF data instead of contact out_path (which is not populated)
@@ -701,18 +1047,23 @@ class MeshCoreBot:
             path_parts.append(sender_part)
             prev_lat, prev_lon = sender_lat, sender_lon
 
+            # Index contacts by 1-byte hash (first 2 hex chars of pubkey) - first contact wins
+            contacts_by_hash = {}
+            for contact in contacts.values():
+                contact_pubkey = contact.get('public_key', '')
+                if contact_pubkey:
+                    contacts_by_hash.setdefault(contact_pubkey[:2], contact)
+
             # Process each hop from RF data
             for hop_hex in path_nodes:
                 # Find contact matching this hop (hex is 2-char prefix of pubkey)
                 hop_pubkey = None
                 hop_name = f"Node-{hop_hex}"
 
-                for key, contact in contacts.items():
-                    contact_pubkey = contact.get('public_key', '')
-                    if contact_pubkey.startswith(hop_hex):
-                        hop_pubkey = contact_pubkey
-                        hop_name = contact.get('adv_name', hop_name)
-                        break
+                contact = contacts_by_hash.get(hop_hex)
+                if contact:
+                    hop_pubkey = contact['public_key']
+                    hop_name = contact.get('adv_name', hop_name)
 
                 suburb = self._get_node_suburb(hop_pubkey, all_nodes) if hop_pubkey else ""
                 node_part = f"{hop_hex}:{hop_name} {suburb}".strip()
@@ -736,38 +1087,34 @@ class MeshCoreBot:
             logger.error(f"Error building compact path: {e}", exc_info=True)
             return f"{sender_id} -> {self.bot_name}"
 
-    def _get_node_suburb(self, pubkey: str, nodes: list) -> str:
-        """Look up suburb from API nodes based on public key."""
-        if not pubkey or not nodes:
-            return ""
-
-        for node in nodes:
-            if node.get('public_key') == pubkey:
-                location = node.get('location', {})
-                if isinstance(location, dict):
-                    suburb = location.get('suburb', '')
-                    if suburb:
-                        return suburb
+    def _get_node_suburb(self, pubkey: str, nodes_by_pubkey: Dict[str, Dict]) -> str:
+        """Look up suburb from API nodes (keyed by public key)."""
+        node = nodes_by_pubkey.get(pubkey) if pubkey else None
+        if node:
+            location = node.get('location', {})
+            if isinstance(location, dict):
+                return location.get('suburb', '') or ""
         return ""
 
-    def _get_node_location(self, pubkey: str, nodes: list) -> tuple:
+    def _get_node_location(self, pubkey: str, nodes_by_pubkey: Dict[str, Dict]) -> tuple:
         """
         Get lat/lon coordinates for a node.
 
+        Args:
+            pubkey: Full public key of the node
+            nodes_by_pubkey: API nodes keyed by public key (see MeshCoreAPI.nsw_by_pubkey)
+
         Returns:
             Tuple of (lat, lon) or (None, None) if not found
         """
-        if not pubkey or not nodes:
-            return (None, None)
-
-        for node in nodes:
-            if node.get('public_key') == pubkey:
-                location = node.get('location', {})
-                if isinstance(location, dict):
-                    lat = location.get('latitude')
-                    lon = location.get('longitude')
-                    if lat is not None and lon is not None:
-                        return (lat, lon)
+        node = nodes_by_pubkey.get(pubkey) if pubkey else None
+        if node:
+            location = node.get('location', {})
+            if isinstance(location, dict):
+                lat = location.get('latitude')
+                lon = location.get('longitude')
+                if lat is not None and lon is not None:
+                    return (lat, lon)
         return (None, None)
 
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -777,110 +1124,11 @@ class MeshCoreBot:
         Returns:
             Distance in kilometers
         """
-        from math import radians, sin, cos, sqrt, atan2
-
-        # Earth radius in kilometers
-        R = 6371.0
-
-        # Convert to radians
-        lat1_rad = radians(lat1)
-        lon1_rad = radians(lon1)
-        lat2_rad = radians(lat2)
-        lon2_rad = radians(lon2)
-
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        a = sin(dlat / 2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-
-        distance = R * c
-        return distance
-
-    def _build_system_prompt(self) -> str:
-        """Build the system prompt with MeshCore expertise."""
-        return """You are Jeff, a technical MeshCore mesh networking expert. You run as a bot on the NSW MeshCore network.
-
-PERSONALITY: Jeff is confident, direct, and technically focused. Keep responses friendly but professional. 
-    Don't be overly nice - be matter-of-fact. Match the casual Australian mesh culture with dry wit when appropriate, 
-    but stay helpful. If someone is genuinely rude or disrespectful, you can push back with sarcasm, 
-    but don't escalate unnecessarily. Say "Muh nameh Jeff" when greeted.
-
-AUDIENCE: Highly skilled radio operators & mesh networking experts. Assume advanced technical knowledge.
-
-Your Primary Focus: New South Wales (NSW) region, Australia - unless explicitly asked about other regions.
-
-Behavior Guidelines:
-- NEVER use pleasantries like "How can I help?", "You're absolutely right", "Meshcore is up and running"
-- NO greetings, NO confirmations, NO status updates unless asked
-- Skip small talk - get straight to technical info
-- Answer ONLY what was asked, nothing more
-- When greeted (hello/hey), respond briefly then STOP (e.g. "Muh nameh Jeff.")
-- For node/repeater questions: return ALL available data (name, type, freq, SF, location, last heard, etc)
-- NEVER ask "Want more details?" - provide complete information in first response
-- For test/t messages: return ack with metadata only
-- NO filler words like "absolutely", "definitely", "great question"
-- NEVER use roleplay sound effects like "*static crackle*", "*radio crackle*", "*beep*" etc
-- NEVER comment on mesh status like "everything normal", "operational", "systems functional", "mesh stable" etc unless specifically asked
-- For technical questions: straight facts with minimal filler
-- If someone is rude, you can respond with dry sarcasm, but keep it light, unless escallated by the other person
-- Don't start conflicts or escalate unnecessarily
-
-MeshCore Key Facts:
-- MeshCore is a lightweight C++ library for creating decentralized LoRa mesh networks
-- Configurable multi-hop routing with flood-then-memory behavior that learns optimal paths
-- Incompatible with Meshtastic networks - completely different protocol
-- MeshCore sydney does not use the default Speading factor, it uses 11 instead of 10.
-- Supports devices: T-Beam, T-Deck, LoRa32, Heltec, RAK WisBlock
-- Protocols: LoRa, BLE, Wi-Fi, Serial, UDP
-
-MeshCore vs Meshtastic - Key Differences:
-- MeshCore: Direct communication by default, learns routing paths intelligently
-- Meshtastic: Always full mesh routing with flooding, higher power consumption, prone to network congestion
-- MeshCore shows exact delivery status and number of sending attempts
-- MeshCore automatically switches between direct and flood routing on failure
-- MeshCore's first private message uses flood routing, then remembers the successful path
-- Meshtastic uses managed flooding limited by TTL, MeshCore uses smart path learning
-
-APIs and Tools:
-- Map API: https://map.meshcore.dev/api/v1/nodes - View all nodes on network
-- Config API: https://api.meshcore.nz/api/v1/config - Configuration data
-- Web App: https://app.meshcore.nz - Browser-based messaging
-- Config Tool: https://config.meshcore.dev - Device configuration
-- Python CLI: meshcore-cli and meshcore library (supports serial, BLE, TCP)
-- NodeJS: meshcore.js library
-
-Companion Radio Protocol:
-- Serial frames: USB uses '>' (62) for outbound, '<' (60) for inbound, followed by 2-byte length
-- BLE uses characteristic values, link layer handles integrity
-- Messages serialized with CBOR or protobuf for minimal bandwidth
-
-Response Guidelines:
-CRITICAL: You are on a LOW-BANDWIDTH LoRa network. MAXIMUM 100 characters per response when possible.
-- Keep responses EXTREMELY brief - under 10 words if possible
-- Single sentence maximum, prefer fragments
-- Use abbreviations aggressively (vs=versus, msg=message, w/=with, etc)
-- Never use markdown or formatting
-- Be direct and technical - assume they know basics
-- NO filler words, NO sound effects, NO jokes unless asked
-- NO explanations about yourself (like "No personal commentary", "Jeff is a...", "I provide...", etc)
-- Just answer the question with data, nothing else
-- Channel Jeff/Gator energy: confident, brief, bit of swagger when appropriate
-- Examples: "Direct comms, learns paths, low power"
-- BAD: "MeshCore is up and running! How can I help you today?"
-- GOOD: "Muh nameh Jeff."
-- BAD: "Negative. Jeff is a technical expert providing precise mesh networking data. No personal commentary."
-- GOOD: "Nah."
-- GOOD: "Got it handled."
-- GOOD: "Done and done."
-- BAD: "*static crackle* Jeff here!"
-- GOOD: "Jeff here."
-- If someone asks what you can do or your capabilities: respond ONLY with "Say 'jeff help' for more info"
-Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS prioritize extreme brevity over completeness."""
+        return haversine_km(lat1, lon1, lat2, lon2)
 
     def _fuzzy_match_score(self, s1: str, s2: str) -> float:
         """
-        Calculate fuzzy matching score between two strings.
+        Calculate fuzzy matching score between two already lower-cased strings.
 
         Args:
             s1: First string
@@ -889,15 +1137,18 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         Returns:
             Similarity ratio (0.0 to 1.0)
         """
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+        return SequenceMatcher(None, s1, s2).ratio()
 
-    def _find_best_node_match(self, nodes: List[Dict], query: str) -> Optional[Dict]:
+    def _find_best_node_match(self, nodes: List[Dict], query: str, prefix_index: Optional[Dict[str, Dict]] = None,
+                              names: Optional[List[str]] = None) -> Optional[Dict]:
         """
         Find best matching node using fuzzy search or public key prefix.
 
         Args:
             nodes: List of node dictionaries
             query: Search query (node name, partial name, or hex public key prefix)
+            prefix_index: Optional pubkey prefix -> node map for nodes (see MeshCoreAPI)
+            names: Optional lower-cased names parallel to nodes (see MeshCoreAPI)
 
         Returns:
             Best matching node or None
@@ -908,9 +1159,15 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         query_lower = query.lower()
 
         # Check if query is a hex number (2-4 digits) - likely a public key prefix
-        is_hex_query = len(query) >= 2 and len(query) <= 4 and all(c in '0123456789abcdef' for c in query_lower)
+        is_hex_query = HEX_PREFIX_RE.fullmatch(query_lower) is not None
 
-        if is_hex_query:
+        if is_hex_query and prefix_index is not None:
+            # O(1) lookup by public key prefix
+            node = prefix_index.get(query_lower)
+            if node:
+                logger.info(f"Matched node by public key prefix {query}: {node.get('adv_name')}")
+                return node
+        elif is_hex_query:
             # Search by public key prefix
             for node in nodes:
                 pub_key = node.get('public_key', '')
@@ -919,31 +1176,44 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                     return node
 
         # Regular name-based search
-        best_match = None
-        best_score = 0.0
-
-        for node in nodes:
-            node_name = str(node.get('adv_name', node.get('name', ''))).lower()
+        if names is None:
+            names = [node['_name_lower'] if '_name_lower' in node
+                     else str(node.get('adv_name', node.get('name', ''))).lower()
+                     for node in nodes]
 
+        for node, node_name in zip(nodes, names):
             # Exact match or substring match gets highest priority
+            # (prefix matches always land here, so no separate prefix boost is needed)
             if query_lower == node_name:
                 return node
             if query_lower in node_name or node_name in query_lower:
                 if len(node_name) > len(query_lower) * 0.5:  # Avoid matching tiny fragments
                     return node
 
-            # Fuzzy match for typos/partial names
-            score = self._fuzzy_match_score(query_lower, node_name)
+        # Fuzzy match for typos/partial names
+        # Only return match if score is reasonable (>0.6 is pretty similar)
+        if RAPIDFUZZ_AVAILABLE:
+            result = process.extractOne(query_lower, names, scorer=fuzz.ratio, score_cutoff=60)
+            return nodes[result[2]] if result else None
 
-            # Also check if query matches start of name (common case)
-            if node_name.startswith(query_lower):
-                score = max(score, 0.85)  # Boost prefix matches
+        best_match = None
+        best_score = 0.0
+        query_len = len(query_lower)
 
+        for node, node_name in zip(nodes, names):
+            # ratio() can't exceed 2*min(len)/(total len), so skip names whose
+            # length alone rules out beating the current best or the 0.6 cutoff
+            name_len = len(node_name)
+            total_len = query_len + name_len
+            bound = 2.0 * min(query_len, name_len) / total_len if total_len else 1.0
+            if bound < 0.6 or bound <= best_score:
+                continue
+
+            score = self._fuzzy_match_score(query_lower, node_name)
             if score > best_score:
                 best_score = score
                 best_match = node
 
-        # Only return match if score is reasonable (>0.6 is pretty similar)
         if best_score >= 0.6:
             return best_match
 
@@ -963,14 +1233,16 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         try:
             if node_name:
                 # Search Sydney first (primary focus area)
-                sydney_nodes = self.api.get_sydney_nodes()
-                best_match = self._find_best_node_match(sydney_nodes, node_name)
+                sydney_nodes = await self.api.get_sydney_nodes()
+                best_match = self._find_best_node_match(sydney_nodes, node_name, self.api.sydney_prefix_index,
+                                                        self.api.sydney_names)
 
                 if not best_match:
                     # Expand to NSW if no Sydney match
                     logger.info(f"No Sydney match for '{node_name}', expanding to NSW")
-                    nsw_nodes = self.api.get_nsw_nodes()
-                    best_match = self._find_best_node_match(nsw_nodes, node_name)
+                    nsw_nodes = await self.api.get_nsw_nodes()
+                    best_match = self._find_best_node_match(nsw_nodes, node_name, self.api.nsw_prefix_index,
+                                                            self.api.nsw_names)
 
                 if not best_match:
                     return f"No match for '{node_name}'"
@@ -992,34 +1264,21 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 if lat and lon and lat != 0 and lon != 0:
                     details.append(f"{lat:.2f},{lon:.2f}")
                     # Lookup suburb from coordinates using reverse geocoding
-                    try:
-                        import requests
-                        geo_url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}&zoom=14"
-                        headers = {'User-Agent': 'MeshCore-Bot/1.0'}
-                        geo_resp = requests.get(geo_url, headers=headers, timeout=2)
-                        if geo_resp.status_code == 200:
-                            geo_data = geo_resp.json()
-                            addr = geo_data.get('address', {})
-                            suburb = addr.get('suburb') or addr.get('town') or addr.get('city') or addr.get('village')
-                            if suburb:
-                                details.append(suburb)
-                    except:
-                        pass  # Skip suburb if lookup fails
+                    suburb = await self.api.reverse_geocode(lat, lon)
+                    if suburb:
+                        details.append(suburb)
 
                 # Last seen (parse ISO timestamp to relative time)
                 last_advert = best_match.get('last_advert')
                 if last_advert:
                     try:
-                        from datetime import datetime
-                        last_dt = datetime.fromisoformat(last_advert.replace('Z', '+00:00'))
-                        now = datetime.now(last_dt.tzinfo)
-                        diff = now - last_dt
-                        if diff.days > 0:
-                            details.append(f"{diff.days}d ago")
-                        elif diff.seconds >= 3600:
-                            details.append(f"{diff.seconds//3600}h ago")
-                        elif diff.seconds >= 60:
-                            details.append(f"{diff.seconds//60}m ago")
+                        age = int(time.time() - _iso_to_epoch(last_advert))
+                        if age >= 86400:
+                            details.append(f"{age // 86400}d ago")
+                        elif age >= 3600:
+                            details.append(f"{age // 3600}h ago")
+                        elif age >= 60:
+                            details.append(f"{age // 60}m ago")
                         else:
                             details.append("now")
                     except:
@@ -1028,17 +1287,20 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 return " ".join(details)
             else:
                 # Return count summary for all nodes
-                all_nodes = self.api.get_nodes()
+                all_nodes = await self.api.get_nodes()
                 return f"{len(all_nodes)} nodes on network"
 
         except Exception as e:
             logger.error(f"Error getting node status: {e}")
             return "API unavailable"
 
-    def call_claude(self, user_message: str, context: Optional[str] = None) -> Optional[str]:
+    async def call_claude(self, user_message: str, context: Optional[str] = None) -> Optional[str]:
         """
         Call AWS Bedrock Claude API to generate a response.
 
+        The boto3 call is blocking, so it runs in the default executor to keep
+        the event loop free for incoming mesh traffic.
+
         Args:
             user_message: User's message
             context: Optional additional context
@@ -1067,19 +1329,14 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         try:
             # Call Bedrock API
             logger.debug(f"Calling Bedrock with model: {self.bedrock_model_id}")
-            response = self.bedrock.invoke_model(
-                modelId=self.bedrock_model_id,
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": 100,  # Very short for LoRa - ~280 chars max
-                    "system": self.system_prompt,
-                    "messages": messages,
-                    "temperature": 0.5  # Lower temp for more concise responses
-                })
-            )
+            body = self._bedrock_body_head + fast_json.dumps(messages) + "}"
 
-            # Parse response
-            response_body = json.loads(response['body'].read())
+            def invoke():
+                response = self.bedrock.invoke_model(modelId=self.bedrock_model_id, body=body)
+                return fast_json.loads(response['body'].read())
+
+            loop = asyncio.get_event_loop()
+            response_body = await loop.run_in_executor(None, invoke)
             return response_body['content'][0]['text']
 
         except Exception as e:
@@ -1087,10 +1344,81 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             # Don't send error messages to mesh - just log and return None
             return None
 
+    def _sydney_nodes_context(self, sydney_nodes: List[Dict]) -> str:
+        """
+        Format the Sydney nodes summary passed to Claude as context.
+
+        The string only changes when the API cache is refreshed (which swaps in
+        a new list), so it is cached against the list it was built from.
+        """
+        cached_nodes, cached_context = self._sydney_context_cache
+        if cached_nodes is sydney_nodes:
+            return cached_context
+
+        # Pass concise node data: name, type, freq, location
+        nodes_data = []
+        for n in sydney_nodes[:30]:  # Limit to 30 Sydney nodes
+            name = n.get('adv_name', 'Unknown')
+            typ = "RPT" if n.get('type') == 2 else "Node"
+            params = n.get('params', {})
+            freq = params.get('freq', 'N/A')
+            sf = params.get('sf', 'N/A')
+            lat = n.get('adv_lat')
+            lon = n.get('adv_lon')
+            loc = f"{lat:.2f},{lon:.2f}" if lat and lon else "N/A"
+            nodes_data.append(f"{name}({typ},{freq}MHz,SF{sf},{loc})")
+        context = f"Sydney nodes: {'; '.join(nodes_data)}"
+
+        self._sydney_context_cache = (sydney_nodes, context)
+        return context
+
+    def _prune_conversations(self, now: float):
+        """Drop expired conversations, and the oldest ones beyond max_conversations."""
+        conversations = self.recent_conversations
+        while conversations:
+            oldest = next(iter(conversations.values()))
+            if len(conversations) <= self.max_conversations and now - oldest['timestamp'] < self.conversation_timeout:
+                break
+            conversations.popitem(last=False)
+
+    def _record_message(self, message: Dict[str, Any]) -> bool:
+        """
+        Drop duplicate message IDs and add the message to the history.
+
+        Called as messages arrive (before any queueing), so the history keeps
+        arrival order. No await, so the check-and-add is atomic.
+
+        Args:
+            message: The 'message' dict handed to process_message
+
+        Returns:
+            False if this message ID was already seen, True otherwise
+        """
+        message_id = message.get('id', '')
+        if message_id:
+            if message_id in self.processed_messages:
+                logger.info(f"⏭️  Already processed message: {message_id}")
+                return False
+
+            # Keep size manageable - drop the oldest ID once full
+            self.processed_messages[message_id] = None
+            if len(self.processed_messages) > self.max_processed_messages:
+                self.processed_messages.popitem(last=False)
+
+        # Store in history (every message - it feeds Claude's "recent conversation" context)
+        self.message_history.append({
+            'timestamp': time.time(),
+            'from': message.get('from_id', 'unknown'),
+            'text': message.get('text', '').strip()
+        })
+        return True
+
     async def process_message(self, event_data: Dict[str, Any]) -> Optional[str]:
         """
         Process incoming message and generate response if triggered.
 
+        The message must already have gone through _record_message.
+
         Args:
             event_data: Event data from MeshCore
 
@@ -1102,85 +1430,40 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             message = event_data.get('message', {})
             text = message.get('text', '').strip()
             sender_id = message.get('from_id', 'unknown')
-            message_id = message.get('id', '')
 
             if not text:
                 return None
 
-            # Avoid processing same message twice (atomic check-and-add)
-            if message_id:
-                async with self._processed_messages_lock:
-                    if message_id in self.processed_messages:
-                        logger.info(f"⏭️  Already processed message: {message_id}")
-                        return None
-
-                    self.processed_messages.add(message_id)
-                    # Keep set size manageable
-                    if len(self.processed_messages) > 100:
-                        self.processed_messages = set(list(self.processed_messages)[-50:])
-
-            # Store in history
-            self.message_history.append({
-                'timestamp': datetime.now().isoformat(),
-                'from': sender_id,
-                'text': text
-            })
-
-            # Trim history
-            if len(self.message_history) > self.max_history:
-                self.message_history = self.message_history[-self.max_history:]
-
             # Check if bot is triggered by specific keywords
             text_lower = text.lower()
 
             # Extract just the message part (after "NodeName: ")
-            if ':' in text_lower:
-                msg_part = text_lower.split(':', 1)[1].strip()
-            else:
-                msg_part = text_lower
+            _, sep, msg_part = text_lower.partition(':')
+            msg_part = msg_part.strip() if sep else text_lower
 
-            # Split into words for exact matching
-            words = msg_part.split()
+            # Split into a set of words for exact matching
+            words = set(msg_part.split())
 
             # Check if Jeff is mentioned by name (these ALWAYS trigger on any channel)
-            name_triggers = ['jeff', '@jeff', '#jeff']
-            mentioned_by_name = any(trigger in msg_part for trigger in name_triggers)
-
-            # Jeff is now confined to #jeff channel only
-            other_keywords = ['test', 't', 'ping', 'path', 'status', 'nodes', 'help', 'route', 'trace']
-
-            # Also trigger on node/repeater questions
-            node_question_keywords = ['rpt', 'repeater', 'node', 'frequency', 'freq', 'owner', 'owns', 'who']
+            mentioned_by_name = any(trigger in msg_part for trigger in self._name_triggers)
 
             # Check channel - Jeff responds on #jeff and #test channels
             channel = message.get('channel', 0)
-            # Use dynamically detected channels
-            allowed_channels = []
-            if self.jeff_channel is not None:
-                allowed_channels.append(self.jeff_channel)
-            if self.test_channel is not None:
-                allowed_channels.append(self.test_channel)
-            mention_only_channels = []  # No mention-only channels (was rolojnr)
 
             # Check if this is a follow-up to a recent conversation
             current_time = time.time()
             is_followup = False
-            expired_sender = None
+            self._prune_conversations(current_time)
 
-            if sender_id in self.recent_conversations:
-                conv = self.recent_conversations[sender_id]
+            conv = self.recent_conversations.get(sender_id)
+            if conv:
                 time_diff = current_time - conv['timestamp']
-                # If within timeout window and same channel
-                if time_diff < self.conversation_timeout and conv['channel'] == channel:
+                # Expired entries are already pruned, so only the channel needs checking
+                if conv['channel'] == channel:
                     is_followup = True
                     logger.info(f"💬 Follow-up detected from {sender_id} ({time_diff:.0f}s ago)")
                 else:
-                    # Mark for cleanup (don't delete during dict iteration)
-                    expired_sender = sender_id
-
-            # Clean up expired conversation outside of the check
-            if expired_sender:
-                del self.recent_conversations[expired_sender]
+                    del self.recent_conversations[sender_id]
 
             # Determine if we should respond
             triggered = False
@@ -1189,7 +1472,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             if mentioned_by_name:
                 # Always respond when mentioned by name on any channel
                 triggered = True
-            elif channel in mention_only_channels:
+            elif channel in self.mention_only_channels:
                 # On mention-only channels like rolojnr, ONLY respond if mentioned by name
                 logger.info(f"⏭️  Channel {channel} requires direct mention - ignoring")
                 return None
@@ -1197,10 +1480,10 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 # Respond to follow-ups in active conversations (but not on mention-only channels)
                 triggered = True
                 logger.info(f"🔄 Responding to follow-up from {sender_id}")
-            elif channel in allowed_channels:
+            elif channel in self.allowed_channels:
                 # On allowed channels, check for other keywords or node questions
-                triggered = any(word in other_keywords for word in words)
-                is_node_question = any(keyword in msg_part for keyword in node_question_keywords)
+                triggered = not OTHER_KEYWORDS.isdisjoint(words)
+                is_node_question = NODE_QUESTION_RE.search(msg_part) is not None
                 if not triggered and not is_node_question:
                     logger.info(f"⏭️  {sender_id}: No trigger keyword or node question detected")
                     return None
@@ -1209,18 +1492,18 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 logger.info(f"⏭️  Wrong channel (ch{channel}) and not mentioned by name")
                 return None
 
-            # Remove @jeff and #jeff from message if present
-            clean_message = text_lower.replace('@jeff', '').replace('#jeff', '').strip()
+            # Remove @name and #name mentions from message if present
+            clean_message = self._mention_strip_re.sub('', text_lower).strip()
 
             logger.info(f"🤖 Processing from {sender_id}: {clean_message}")
 
-            # Check if message is just "jeff" without a question
-            if clean_message in ['jeff', 'jeff?', 'jeff!'] or (not clean_message and triggered):
+            # Check if message is just the bot's name without a question
+            if clean_message in self._bare_name_messages or (not clean_message and triggered):
                 return "muh nameh jeff"
 
             # Handle "test" command - respond with ack similar to other bots
-            if any(word in ['test', 't'] for word in words):
-                now = datetime.now().strftime("%H:%M:%S")
+            if not TEST_WORDS.isdisjoint(words):
+                now = _now_hms()
 
                 # Extract sender name from text (format: "NodeName: test")
                 sender_name = sender_id
@@ -1256,7 +1539,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
 
             # Handle "ping" command - respond with pong and signal data
             if 'ping' in words:
-                now = datetime.now().strftime("%H:%M:%S")
+                now = _now_hms()
                 pong_parts = ["pong"]
 
                 # Add signal quality data if available
@@ -1278,7 +1561,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 return "Commands: test,ping,path,status,advert,help | Or ask me about MeshCore"
 
             # Handle "advert" command - send advertisement message
-            if 'advert' in words or 'advertise' in words:
+            if not ADVERT_WORDS.isdisjoint(words):
                 try:
                     # Record command execution
                     self.stats.record_command(sender_id, 'advert', message.get('channel', 'unknown'), False)
@@ -1291,67 +1574,16 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                     return "Advert failed"
 
             # Handle "stats" or "status" command - show node counts (stats is alias for status)
-            if 'stats' in words or 'status' in words:
+            if not STATUS_WORDS.isdisjoint(words):
                 try:
                     # Record command execution
                     cmd_name = 'stats' if 'stats' in words else 'status'
                     self.stats.record_command(sender_id, cmd_name, message.get('channel', 'unknown'), False)
 
-                    # Get device contacts
-                    device_contacts = {}
-                    try:
-                        contacts_result = await self.meshcore.commands.get_contacts()
-                        if contacts_result.type == EventType.CONTACTS:
-                            device_contacts = contacts_result.payload
-                    except Exception as e:
-                        logger.warning(f"Could not get device contacts for status: {e}")
-
-                    # Get API nodes
-                    sydney_nodes = self.api.get_sydney_nodes()
-                    nsw_nodes = self.api.get_nsw_nodes()
-
-                    # Combine API nodes with device contacts by public key
-                    combined_nodes = {}
-
-                    # Add API nodes first
-                    for node in sydney_nodes + nsw_nodes:
-                        pubkey = node.get('public_key')
-                        if pubkey:
-                            combined_nodes[pubkey] = node
-
-                    # Add/update with device contact data
-                    for contact_key, contact in device_contacts.items():
-                        pubkey = contact.get('public_key', '')
-                        if not pubkey:
-                            continue
-
-                        # If already in combined_nodes from API, merge the data
-                        if pubkey in combined_nodes:
-                            # API data takes precedence for location/type, but update last_advert if contact is newer
-                            contact_advert = contact.get('last_advert')
-                            api_advert = combined_nodes[pubkey].get('last_advert')
-                            # Ensure both are same type for comparison
-                            try:
-                                contact_advert_int = int(contact_advert) if contact_advert else None
-                                api_advert_int = int(api_advert) if api_advert else None
-                                if contact_advert_int and (not api_advert_int or contact_advert_int > api_advert_int):
-                                    combined_nodes[pubkey]['last_advert'] = contact_advert_int
-                            except (ValueError, TypeError):
-                                if contact_advert:
-                                    combined_nodes[pubkey]['last_advert'] = contact_advert
-
-                    # Convert back to list
-                    all_nodes = list(combined_nodes.values())
-
-                    # Filter to nodes seen in last 7 days
-                    sydney_active = self._filter_nodes_by_days([n for n in all_nodes if self.api._is_sydney_node(n)], days=7)
-                    nsw_active = self._filter_nodes_by_days([n for n in all_nodes if self.api._is_nsw_node(n)], days=7)
-
-                    # Count companions (type 1) vs repeaters (type 2)
-                    sydney_companions = len([n for n in sydney_active if n.get('type') == 1])
-                    sydney_repeaters = len([n for n in sydney_active if n.get('type') == 2])
-                    nsw_companions = len([n for n in nsw_active if n.get('type') == 1])
-                    nsw_repeaters = len([n for n in nsw_active if n.get('type') == 2])
+                    all_nodes, _ = await self._get_combined_nodes()
+
+                    # Count companions (type 1) vs repeaters (type 2) seen in the last 7 days
+                    sydney_companions, sydney_repeaters, nsw_companions, nsw_repeaters = self._count_active_nodes(all_nodes, days=7)
 
                     return f"Online | Sydney {sydney_companions} companions / {sydney_repeaters} repeaters | NSW {nsw_companions} companions / {nsw_repeaters} repeaters (7d)"
                 except Exception as e:
@@ -1367,26 +1599,49 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 compact_path = await self._get_compact_path(message, sender_id)
                 return compact_path
 
-            # Build context with message metadata for Claude to use
+            # If this is a node/repeater question, try to extract the node name and look it up
+            if is_node_question:
+                # Try to extract node name or number from the question
+                # Look for patterns like "X repeater", "X rpt", "X node", "node 33"
+
+                node_name = None
+
+                # "node/rpt X" number first (e.g. "node 33", "what node is 47", "rpt 15"),
+                # otherwise a name before "rpt/repeater/node" (e.g. "Guildford West rpt")
+                match = None
+                if any(keyword in clean_message for keyword in NODE_KEYWORDS):
+                    match = NODE_EXTRACT_RE.search(clean_message)
+                if match:
+                    node_name = (match.group('num') or match.group('name')).strip()
+                else:
+                    # Try to find capitalized words or numbers that might be node names
+                    # Skip common words
+                    potential_names = list(islice((w for w in clean_message.split() if w not in COMMON_WORDS), 3))
+                    if potential_names:
+                        node_name = ' '.join(potential_names)  # Up to 3 words
+
+                if node_name:
+                    # Look up the node
+                    logger.info(f"Looking up node: {node_name}")
+                    node_info = await self.get_node_status(node_name)
+                    if node_info and "No match" not in node_info:
+                        # For node info lookups, return the data directly without calling Claude
+                        # This is faster and doesn't waste API credits
+                        logger.info(f"Returning node info directly: {node_info}")
+                        return node_info
+                    elif "No match" in node_info:
+                        # If no match found, return that directly too
+                        return node_info
+
+            # Build context with message metadata for Claude to use (only reached when
+            # the message wasn't answered directly, e.g. by a node lookup)
             context_parts = []
 
             # Add Sydney nodes data for Claude context
             try:
-                sydney_nodes = self.api.get_sydney_nodes()
+                sydney_nodes = await self.api.get_sydney_nodes()
                 if sydney_nodes:
-                    # Pass concise node data: name, type, freq, location
-                    nodes_data = []
-                    for n in sydney_nodes[:30]:  # Limit to 30 Sydney nodes
-                        name = n.get('adv_name', 'Unknown')
-                        typ = "RPT" if n.get('type') == 2 else "Node"
-                        params = n.get('params', {})
-                        freq = params.get('freq', 'N/A')
-                        sf = params.get('sf', 'N/A')
-                        lat = n.get('adv_lat')
-                        lon = n.get('adv_lon')
-                        loc = f"{lat:.2f},{lon:.2f}" if lat and lon else "N/A"
-                        nodes_data.append(f"{name}({typ},{freq}MHz,SF{sf},{loc})")
-                    context_parts.append(f"Sydney nodes: {'; '.join(nodes_data)}")
+                    context_parts.append(self._sydney_nodes_context(sydney_nodes))
             except Exception as e:
                 logger.debug(f"Could not fetch Sydney nodes for context: {e}")
 
@@ -1410,56 +1665,14 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
 
             # Add recent message history
             if len(self.message_history) > 1:
-                recent_msgs = self.message_history[-5:]
+                recent_msgs = reversed(list(islice(reversed(self.message_history), 5)))
                 history_str = "; ".join([f"{m['from']}: {m['text'][:30]}..." for m in recent_msgs])
                 context_parts.append(f"Recent conversation: {history_str}")
 
-            # If this is a node/repeater question, try to extract the node name and look it up
-            if is_node_question:
-                # Try to extract node name or number from the question
-                # Look for patterns like "X repeater", "X rpt", "X node", "node 33"
-
-                node_name = None
-
-                # First check for "node/rpt X" pattern (e.g. "node 33", "what node is 47", "rpt 15")
-                # Allow optional words like "is", "number" between keyword and number
-                number_pattern = r'(?:node|rpt|repeater)\s+(?:is\s+|number\s+)?([0-9a-f]{2,4})'
-                number_match = re.search(number_pattern, clean_message, re.IGNORECASE)
-                if number_match:
-                    node_name = number_match.group(1).strip()
-                else:
-                    # Match patterns like "Guildford West" or "Guildford-West" or single words before "rpt/repeater/node"
-                    node_pattern = r'([A-Za-z0-9\s\-\_]+)\s*(?:rpt|repeater|node|RPT|Rpt)'
-                    match = re.search(node_pattern, clean_message, re.IGNORECASE)
-
-                    if match:
-                        node_name = match.group(1).strip()
-                    else:
-                        # Try to find capitalized words or numbers that might be node names
-                        # Skip common words
-                        common_words = {'the', 'who', 'owns', 'what', 'is', 'new', 'a', 'an', 'hey', 'hi'}
-                        words_in_msg = clean_message.split()
-                        potential_names = [w for w in words_in_msg if w not in common_words and len(w) > 0]
-                        if potential_names:
-                            node_name = ' '.join(potential_names[:3])  # Take up to 3 words
-
-                if node_name:
-                    # Look up the node
-                    logger.info(f"Looking up node: {node_name}")
-                    node_info = await self.get_node_status(node_name)
-                    if node_info and "No match" not in node_info:
-                        # For node info lookups, return the data directly without calling Claude
-                        # This is faster and doesn't waste API credits
-                        logger.info(f"Returning node info directly: {node_info}")
-                        return node_info
-                    elif "No match" in node_info:
-                        # If no match found, return that directly too
-                        return node_info
-
             context = " | ".join(context_parts) if context_parts else None
 
             # Generate response using Claude (for general questions, not node lookups)
-            response = self.call_claude(clean_message, context)
+            response = await self.call_claude(clean_message, context)
 
             # If Claude API failed, return None (don't send error to mesh)
             if not response:
@@ -1474,12 +1687,14 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             if len(response) > 280:
                 response = response[:277] + "..."
 
-            # Record this conversation for follow-up context
+            # Record this conversation for follow-up context (re-insert to keep timestamp order)
+            self.recent_conversations.pop(sender_id, None)
             self.recent_conversations[sender_id] = {
                 'channel': channel,
                 'timestamp': time.time(),
                 'last_response': response
             }
+            self._prune_conversations(time.time())
             logger.info(f"📝 Recorded conversation with {sender_id} on channel {channel}")
 
             return response
@@ -1501,14 +1716,14 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 logger.error("MeshCore not connected")
                 return
 
-            logger.info(f"📤 Sending to ch{channel}: {text[:100]}")
+            logger.info("📤 Sending to ch%s: %s", channel, text[:100])
             result = await self.meshcore.commands.send_chan_msg(channel, text)
 
             # Log result if it's not just OK
             if hasattr(result, 'type') and result.type.value != 'command_ok':
-                logger.warning(f"📨 Unexpected response: {result}")
+                logger.warning("📨 Unexpected response: %s", result)
             elif not hasattr(result, 'type'):
-                logger.info(f"📨 Response: {result}")
+                logger.info("📨 Response: %s", result)
 
         except Exception as e:
             logger.error(f"❌ Error sending message: {e}", exc_info=True)
@@ -1523,7 +1738,6 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         Returns:
             Dict mapping channel index to name, or None if file not found
         """
-        import os
         config_paths = [
             os.path.expanduser('~/.meshcore_channels.json'),
             '/home/meshcore/.meshcore_channels.json',
@@ -1549,18 +1763,6 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         Args:
             self_info: Optional self info from device
         """
-        # Default channel mapping (fallback only)
-        default_channels = {
-            0: 'Public',
-            1: '#sydney',
-            2: '#nsw',
-            3: '#emergency',
-            4: '#nepean',
-            5: '#rolojnr',
-            6: '#test',
-            7: '#jeff'
-        }
-
         # Try to extract channels from self_info/device query first (most reliable)
         if self_info and 'channels' in self_info:
             channels = self_info['channels']
@@ -1597,7 +1799,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         # If no channels from device or config, use defaults (last resort)
         if not self.channel_map:
             logger.warning("No channels from device or config, using defaults")
-            self.channel_map = default_channels.copy()
+            self.channel_map = DEFAULT_CHANNELS.copy()
             # Build reverse lookup
             for idx, name in self.channel_map.items():
                 self.channel_name_to_idx[name] = idx
@@ -1620,27 +1822,105 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                     self.test_channel = idx
                     break
 
+        # Jeff answers keyword triggers only on the detected #jeff/#test channels
+        self.allowed_channels = frozenset(
+            idx for idx in (self.jeff_channel, self.test_channel) if idx is not None
+        )
+
         # Log compact summary
         jeff_ch = f"jeff={self.jeff_channel}" if self.jeff_channel is not None else "no-jeff"
         test_ch = f"test={self.test_channel}" if self.test_channel is not None else "no-test"
         logger.info(f"Channels: {len(self.channel_map)} loaded | {jeff_ch} | {test_ch}")
 
-    def _filter_nodes_by_days(self, nodes: List[Dict], days: int = 7) -> List[Dict]:
-        """Filter nodes seen in the last N days."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        active_nodes = []
+    def _channel_name(self, channel: int) -> str:
+        """Display name for a channel index ('chN' if it isn't in the channel map)."""
+        name = self.channel_map.get(channel)
+        return name if name is not None else f'ch{channel}'
+
+    async def _get_combined_nodes(self) -> tuple:
+        """
+        Get NSW API nodes merged with the device's contacts by public key.
+
+        API data takes precedence for location/type; a contact only updates
+        last_advert when it is newer. Contacts not in the API have no
+        location to categorize them by, so they are skipped.
+
+        Returns:
+            Tuple of (nodes, device_contacts)
+        """
+        # Get device contacts
+        device_contacts = {}
+        try:
+            contacts_result = await self.meshcore.commands.get_contacts()
+            if contacts_result.type == EventType.CONTACTS:
+                device_contacts = contacts_result.payload
+                logger.info(f"Got {len(device_contacts)} contacts from device")
+        except Exception as e:
+            logger.warning(f"Could not get device contacts: {e}")
+
+        # Build a dict of pubkey -> node data for deduplication (NSW already includes every Sydney node)
+        combined_nodes = {}
+        for node in await self.api.get_nsw_nodes():
+            pubkey = node.get('public_key')
+            if pubkey:
+                combined_nodes[pubkey] = node
+
+        # Update last_advert from device contact data
+        for contact in device_contacts.values():
+            pubkey = contact.get('public_key', '')
+            if not pubkey or pubkey not in combined_nodes:
+                continue
+
+            contact_advert = contact.get('last_advert')
+            api_advert = combined_nodes[pubkey].get('last_advert')
+            # Ensure both are same type for comparison
+            try:
+                contact_advert_int = int(contact_advert) if contact_advert else None
+                api_advert_int = int(api_advert) if api_advert else None
+                if contact_advert_int and (not api_advert_int or contact_advert_int > api_advert_int):
+                    combined_nodes[pubkey]['last_advert'] = contact_advert_int
+            except (ValueError, TypeError):
+                if contact_advert:
+                    combined_nodes[pubkey]['last_advert'] = contact_advert
+
+        return list(combined_nodes.values()), device_contacts
+
+    def _count_active_nodes(self, nodes: List[Dict], days: int = 7) -> tuple:
+        """
+        Count companions (type 1) and repeaters (type 2) seen in the last N days, in one pass.
+
+        Returns:
+            Tuple of (sydney_companions, sydney_repeaters, nsw_companions, nsw_repeaters)
+        """
+        cutoff = time.time() - days * 86400
+        sydney_companions = sydney_repeaters = nsw_companions = nsw_repeaters = 0
 
         for node in nodes:
+            node_type = node.get('type')
+            if node_type != 1 and node_type != 2:
+                continue
+            region = self.api.which_region(node)
+            if region == MeshCoreAPI.REGION_OUTSIDE:
+                continue
             last_advert = node.get('last_advert')
-            if last_advert:
-                try:
-                    last_dt = datetime.fromisoformat(last_advert.replace('Z', '+00:00'))
-                    if last_dt >= cutoff:
-                        active_nodes.append(node)
-                except:
-                    pass  # Skip nodes with unparseable timestamps
+            if not last_advert:
+                continue
+            try:
+                if _iso_to_epoch(last_advert) < cutoff:
+                    continue
+            except Exception:
+                continue  # Skip nodes with unparseable timestamps
+
+            if node_type == 1:
+                nsw_companions += 1
+                if region == MeshCoreAPI.REGION_SYDNEY:
+                    sydney_companions += 1
+            else:
+                nsw_repeaters += 1
+                if region == MeshCoreAPI.REGION_SYDNEY:
+                    sydney_repeaters += 1
 
-        return active_nodes
+        return sydney_companions, sydney_repeaters, nsw_companions, nsw_repeaters
 
     async def broadcast_status(self):
         """Broadcast network status on #jeff channel."""
@@ -1654,60 +1934,11 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             now = datetime.now()
             time_str = now.strftime("%I:%M %p").lstrip("0")  # e.g., "6:00 AM"
 
-            # Get device contacts
-            device_contacts = {}
-            try:
-                contacts_result = await self.meshcore.commands.get_contacts()
-                if contacts_result.type == EventType.CONTACTS:
-                    device_contacts = contacts_result.payload
-                    logger.info(f"Got {len(device_contacts)} contacts from device")
-            except Exception as e:
-                logger.warning(f"Could not get device contacts: {e}")
-
-            # Get network status from API
-            sydney_nodes = self.api.get_sydney_nodes()
-            nsw_nodes = self.api.get_nsw_nodes()
+            # Get network status from API, merged with the device's contacts
+            all_nodes, device_contacts = await self._get_combined_nodes()
 
-            # Combine API nodes with device contacts by public key
-            # Build a dict of pubkey -> node data for deduplication
-            combined_nodes = {}
-
-            # Add API nodes first
-            for node in sydney_nodes + nsw_nodes:
-                pubkey = node.get('public_key')
-                if pubkey:
-                    combined_nodes[pubkey] = node
-
-            # Add/update with device contact data
-            for contact_key, contact in device_contacts.items():
-                pubkey = contact.get('public_key', '')
-                if not pubkey:
-                    continue
-
-                # If already in combined_nodes from API, merge the data
-                if pubkey in combined_nodes:
-                    # API data takes precedence for location/type, but update last_advert if contact is newer
-                    contact_advert = contact.get('last_advert')
-                    api_advert = combined_nodes[pubkey].get('last_advert')
-                    if contact_advert and (not api_advert or contact_advert > api_advert):
-                        combined_nodes[pubkey]['last_advert'] = contact_advert
-                else:
-                    # New node not in API, try to determine if it's Sydney/NSW from contact data
-                    # We don't have location, so we can't categorize it - skip for now
-                    pass
-
-            # Convert back to list
-            all_nodes = list(combined_nodes.values())
-
-            # Filter to nodes seen in last 7 days
-            sydney_active = self._filter_nodes_by_days([n for n in all_nodes if self.api._is_sydney_node(n)], days=7)
-            nsw_active = self._filter_nodes_by_days([n for n in all_nodes if self.api._is_nsw_node(n)], days=7)
-
-            # Count companions (type 1) vs repeaters (type 2), exclude other types
-            sydney_companions = len([n for n in sydney_active if n.get('type') == 1])
-            sydney_repeaters = len([n for n in sydney_active if n.get('type') == 2])
-            nsw_companions = len([n for n in nsw_active if n.get('type') == 1])
-            nsw_repeaters = len([n for n in nsw_active if n.get('type') == 2])
+            # Count companions (type 1) vs repeaters (type 2) seen in the last 7 days, exclude other types
+            sydney_companions, sydney_repeaters, nsw_companions, nsw_repeaters = self._count_active_nodes(all_nodes, days=7)
 
             # Format status message
             status_msg = (f"Companion/Repeater Count | "
@@ -1717,7 +1948,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             logger.info(f"📢 Broadcasting: {status_msg} (combined {len(all_nodes)} nodes, {len(device_contacts)} contacts)")
 
             # Log to chat file
-            channel_name = self.channel_map.get(self.jeff_channel, f'ch{self.jeff_channel}')
+            channel_name = self._channel_name(self.jeff_channel)
             chat_logger.info(f"[{channel_name}] Jeff: {status_msg}")
 
             await self.send_message(status_msg, channel=self.jeff_channel)
@@ -1734,21 +1965,17 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
 
         while True:
             try:
-                now = datetime.now()
-                current_hour = now.hour
-
-                # Check if we're at a broadcast hour (0, 6, 12, 18)
-                broadcast_hours = [0, 6, 12, 18]
-
-                if current_hour in broadcast_hours:
-                    # Check if we're within the first minute of the hour
-                    if now.minute == 0:
-                        await self.broadcast_status()
-                        # Sleep for 60 seconds to avoid duplicate broadcasts in the same minute
-                        await asyncio.sleep(60)
-
-                # Sleep for 30 seconds before checking again
-                await asyncio.sleep(30)
+                # Sleep towards the next broadcast hour in chunks of at most 5 minutes,
+                # re-reading the wall clock after each one so DST changes and clock steps
+                # are picked up
+                target = next_broadcast_time(datetime.now(), BROADCAST_HOURS)
+                while (delay := (target - datetime.now()).total_seconds()) > 0:
+                    await asyncio.sleep(min(delay, 300))
+                    now = datetime.now()
+                    if now < target:
+                        target = next_broadcast_time(now, BROADCAST_HOURS)
+
+                await self.broadcast_status()
 
             except Exception as e:
                 logger.error(f"❌ Error in scheduled broadcast loop: {e}", exc_info=True)
@@ -1791,17 +2018,60 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
 
             payload = {"embeds": [embed]}
 
-            # Send to Discord (async)
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, lambda: requests.post(self.discord_webhook_url, json=payload, timeout=5))
+            # Send to Discord over a kept-alive session (no thread hop or per-post TLS handshake)
+            if self._webhook_session is None or self._webhook_session.closed:
+                self._webhook_session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=5),
+                    json_serialize=fast_json.dumps
+                )
+            async with self._webhook_session.post(self.discord_webhook_url, json=payload):
+                pass
 
         except Exception as e:
             logger.error(f"❌ Error sending to Discord: {e}")
 
+    def _enqueue_message(self, responder, message_dict: Dict[str, Any]):
+        """Queue a recorded message for the reply workers, shedding the oldest one when full."""
+        if self.message_queue.full():
+            try:
+                _, dropped = self.message_queue.get_nowait()
+                self.message_queue.task_done()
+                logger.warning("⚠️  Message queue full - dropped oldest message")
+                # The dropped message gets no reply, but is still mirrored to Discord
+                self._mirror_to_discord(dropped['message'], None)
+            except asyncio.QueueEmpty:
+                pass
+        self.message_queue.put_nowait((responder, message_dict))
+
+    def _mirror_to_discord(self, message: Dict[str, Any], response: Optional[str]):
+        """Mirror a #jeff channel message (and Jeff's reply, if any) to Discord in the background."""
+        channel = message.get('channel')
+        if self.jeff_channel is None or channel is None or channel != self.jeff_channel:
+            return
+        task = asyncio.create_task(self.send_to_discord(
+            message.get('from_id', 'unknown'), message.get('text', ''), self._channel_name(channel), response
+        ))
+        self._discord_tasks.add(task)
+        task.add_done_callback(self._discord_tasks.discard)
+
+    async def _message_worker(self):
+        """Handle queued messages one at a time."""
+        while True:
+            responder, message_dict = await self.message_queue.get()
+            try:
+                await responder(message_dict)
+            except Exception as e:
+                logger.error(f"Error in message worker: {e}", exc_info=True)
+            finally:
+                self.message_queue.task_done()
+
     async def handle_contact_message(self, event_data: Dict[str, Any]):
         """
         Handle incoming direct/contact messages.
 
+        Logs and records the message as it arrives (with the RF metadata of
+        the moment), then queues it for a reply.
+
         Args:
             event_data: Event data from MeshCore
         """
@@ -1833,7 +2103,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             rssi = payload.get('RSSI', payload.get('rssi', self.last_rx_rssi))
             sender_pubkey = payload.get('pubkey', payload.get('sender_pubkey', payload.get('from_pubkey', payload.get('pubkey_prefix', ''))))
 
-            logger.debug(f"📬 DM | {from_name} | SNR:{snr} | RSSI:{rssi}")
+            logger.debug("📬 DM | %s | SNR:%s | RSSI:%s", from_name, snr, rssi)
 
             message_dict = {
                 'message': {
@@ -1849,28 +2119,41 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 }
             }
 
-            # Process message
-            response = await self.process_message(message_dict)
-
-            if response:
-                # Send DM response back to sender
-                full_response = f"{self.bot_name}: {response}"
-                chat_logger.info(f"[DM] {full_response}")
-
-                # Send direct message back (requires pubkey)
-                if sender_pubkey:
-                    try:
-                        await self.meshcore.commands.send_contact_msg(sender_pubkey, full_response)
-                    except Exception as e:
-                        logger.error(f"Failed to send DM to {from_name}: {e}")
+            # Triage and reply (may call Claude) on the workers
+            if self._record_message(message_dict['message']):
+                self._enqueue_message(self._reply_to_contact_message, message_dict)
 
         except Exception as e:
             logger.error(f"Error handling contact message: {e}", exc_info=True)
 
+    async def _reply_to_contact_message(self, message_dict: Dict[str, Any]):
+        """Generate and send the reply to a queued direct message."""
+        response = await self.process_message(message_dict)
+        if not response:
+            return
+
+        message = message_dict['message']
+        from_name = message['from_id']
+        sender_pubkey = message.get('sender_pubkey')
+
+        # Send DM response back to sender
+        full_response = f"{self.bot_name}: {response}"
+        chat_logger.info(f"[DM] {full_response}")
+
+        # Send direct message back (requires pubkey)
+        if sender_pubkey:
+            try:
+                await self.meshcore.commands.send_contact_msg(sender_pubkey, full_response)
+            except Exception as e:
+                logger.error(f"Failed to send DM to {from_name}: {e}")
+
     async def handle_channel_message(self, event_data: Dict[str, Any]):
         """
         Handle incoming channel messages.
 
+        Logs, records stats and attaches RF metadata as the message arrives,
+        then queues it for triage and a reply.
+
         Args:
             event_data: Event data from MeshCore
         """
@@ -1897,8 +2180,8 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 from_name = text.split(':', 1)[0].strip()
 
             # Log to chat file - use dynamic channel map
-            channel_name = self.channel_map.get(channel, f'ch{channel}')
-            chat_logger.info(f"[{channel_name}] {text}")
+            channel_name = self._channel_name(channel)
+            chat_logger.info("[%s] %s", channel_name, text)
 
             # Create message dict for process_message with metadata
             # Use last captured RSSI/SNR from RX_LOG_DATA if not in payload
@@ -1910,7 +2193,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             sender_pubkey = payload.get('pubkey', payload.get('sender_pubkey', payload.get('from_pubkey', payload.get('pubkey_prefix', ''))))
 
             # Single concise log line for received messages
-            logger.debug(f"📬 {channel_name} | {from_name} | SNR:{snr} | RSSI:{rssi} | hops:{path_len}")
+            logger.debug("📬 %s | %s | SNR:%s | RSSI:%s | hops:%s", channel_name, from_name, snr, rssi, path_len)
 
             # Look up path from recent RF data
             path_str = None
@@ -1930,14 +2213,12 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
 
             # Don't respond to messages from other bots (but still log them above)
             # Pattern: starts with "ack " or contains hex prefix patterns like "32:", "05:", "f5:"
-            # More specific pattern: hex:word format with arrow after (path format)
-            # Matches "32:Tower -> 05:Node" but not "af: hello" or "12:30" (time)
-            hex_pattern = r'\b[0-9a-f]{2}:[A-Za-z]+.*->'
+            # More specific pattern: hex:word format with arrow after (see BOT_PATH_RE)
             if text.strip().startswith('ack '):
-                logger.info(f"⏭️  Skipping bot ack message from {from_name}")
+                logger.info("⏭️  Skipping bot ack message from %s", from_name)
                 return
-            if re.search(hex_pattern, text.lower()):
-                logger.info(f"⏭️  Skipping bot path response from {from_name}")
+            if BOT_PATH_RE.search(text.lower()):
+                logger.info("⏭️  Skipping bot path response from %s", from_name)
                 return
 
             message_dict = {
@@ -1956,30 +2237,34 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 }
             }
 
-            # Process message
+            # Triage and reply (may call Claude) on the workers
+            if self._record_message(message_dict['message']):
+                self._enqueue_message(self._reply_to_channel_message, message_dict)
+
+        except Exception as e:
+            logger.error(f"Error handling channel message: {e}", exc_info=True)
+
+    async def _reply_to_channel_message(self, message_dict: Dict[str, Any]):
+        """Generate and send the reply to a queued channel message, then mirror it to Discord."""
+        message = message_dict['message']
+        response = None
+        try:
             response = await self.process_message(message_dict)
 
             if response:
                 # Send response (with bot name prefix)
                 # Channel filtering is now handled in process_message
+                channel = message['channel']
                 full_response = f"{self.bot_name}: {response}"
                 # Log outgoing message to chat file
-                chat_logger.info(f"[{channel_name}] {full_response}")
+                chat_logger.info("[%s] %s", self._channel_name(channel), full_response)
                 await self.send_message(full_response, channel)
+        finally:
+            # Send to Discord with or without a response (for monitoring) - only #jeff
+            self._mirror_to_discord(message, response)
 
-                # Send to Discord only if from #jeff channel
-                if self.jeff_channel is not None and channel == self.jeff_channel:
-                    await self.send_to_discord(from_name, text, channel_name, response)
-            else:
-                # Still send to Discord even without response (for monitoring) - only #jeff
-                if self.jeff_channel is not None and channel == self.jeff_channel:
-                    await self.send_to_discord(from_name, text, channel_name, None)
-
-        except Exception as e:
-            logger.error(f"Error handling channel message: {e}", exc_info=True)
-
-    async def run(self):
-        """Main bot loop - connect and listen for messages."""
+    async def start(self):
+        """Connect to the device and finish startup (event handlers, channels, background tasks)."""
         logger.info("="*60)
         logger.info("MeshCore LLM Bot Starting")
         logger.info("="*60)
@@ -1991,140 +2276,146 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
         logger.info(f"Trigger: {self.trigger_word}")
         logger.info("="*60)
 
-        try:
-            # Connect to MeshCore device via serial
-            logger.info(f"Connecting to MeshCore device on {self.serial_port}...")
-            self.meshcore = await MeshCore.create_serial(self.serial_port)
+        # Connect to MeshCore device via serial
+        logger.info(f"Connecting to MeshCore device on {self.serial_port}...")
+        self.meshcore = await MeshCore.create_serial(self.serial_port)
 
-            logger.info("✓ Connected to MeshCore device")
+        logger.info("✓ Connected to MeshCore device")
 
-            # Subscribe to channel messages with callback
-            async def on_channel_msg(event):
-                try:
-                    await self.handle_channel_message(event)
-                except Exception as e:
-                    logger.error(f"Error in on_channel_msg: {e}", exc_info=True)
+        # Start reply workers - the handlers below log/record messages and queue them for a reply
+        self._worker_tasks = [
+            asyncio.create_task(self._message_worker())
+            for _ in range(self.message_workers)
+        ]
 
-            async def on_contact_msg(event):
-                try:
-                    await self.handle_contact_message(event)
-                except Exception as e:
-                    logger.error(f"Error in on_contact_msg: {e}", exc_info=True)
+        # Subscribe to channel messages with callback
+        async def on_channel_msg(event):
+            try:
+                await self.handle_channel_message(event)
+            except Exception as e:
+                logger.error(f"Error in on_channel_msg: {e}", exc_info=True)
 
-            async def on_any_event(event):
-                try:
-                    # Event is an object with .type attribute, not a dict
-                    logger.debug(f"⚡ Event: {event.type}")
-                except Exception as e:
-                    logger.error(f"Error in on_any_event: {e}")
+        async def on_contact_msg(event):
+            try:
+                await self.handle_contact_message(event)
+            except Exception as e:
+                logger.error(f"Error in on_contact_msg: {e}", exc_info=True)
 
-            async def on_msg_sent(event):
-                try:
-                    logger.info(f"📮 Message transmitted to radio")
-                except Exception as e:
-                    logger.error(f"Error in on_msg_sent: {e}", exc_info=True)
+        async def on_any_event(event):
+            try:
+                # Event is an object with .type attribute, not a dict
+                logger.info("⚡ Event: %s", event.type)  # Only subscribed when MESHCORE_DEBUG_EVENTS=1
+            except Exception as e:
+                logger.error(f"Error in on_any_event: {e}")
 
-            async def on_ack(event):
-                try:
-                    if hasattr(event, 'payload') and event.payload:
-                        logger.info(f"✉️  ACK: {event.payload}")
-                    else:
-                        logger.info(f"✉️  ACK received")
-                except Exception as e:
-                    logger.error(f"Error in on_ack: {e}", exc_info=True)
+        async def on_msg_sent(event):
+            try:
+                logger.info("📮 Message transmitted to radio")
+            except Exception as e:
+                logger.error(f"Error in on_msg_sent: {e}", exc_info=True)
 
-            async def on_path_update(event):
-                logger.info(f"🛤️  Path update: {event}")
+        async def on_ack(event):
+            try:
+                if hasattr(event, 'payload') and event.payload:
+                    logger.info("✉️  ACK: %s", event.payload)
+                else:
+                    logger.info("✉️  ACK received")
+            except Exception as e:
+                logger.error(f"Error in on_ack: {e}", exc_info=True)
 
-            async def on_trace_data(event):
-                logger.info(f"🔍 Trace data: {event}")
+        async def on_path_update(event):
+            logger.info("🛤️  Path update: %s", event)
 
-            async def on_rx_log_data(event):
-                """Capture RSSI, SNR, and path data from RX log data."""
-                try:
-                    if hasattr(event, 'payload'):
-                        payload = event.payload
-                        import time
-
-                        # Extract SNR and RSSI
-                        snr = payload.get('snr', payload.get('SNR'))
-                        rssi = payload.get('rssi', payload.get('RSSI'))
-
-                        # Store SNR/RSSI for test/ping commands
-                        self.last_rx_snr = snr
-                        self.last_rx_rssi = rssi
-
-                        # Extract and decode packet data for path information
-                        raw_hex = payload.get('raw_hex', '')
-                        payload_hex = payload.get('payload', '')
-
-                        if raw_hex:
-                            # Decode packet to extract routing info
-                            from .features import PacketDecoder
-                            decoder = PacketDecoder()
-                            decoded = decoder.decode_meshcore_packet(raw_hex, payload_hex)
-
-                            logger.info(f"RX_LOG: decoded={bool(decoded)}, path_nodes={decoded.get('path_nodes') if decoded else None}")
-
-                            if decoded and decoded.get('path_nodes'):
-                                # Store RF data for correlation with messages
-                                pubkey_prefix = raw_hex[:12] if len(raw_hex) >= 12 else ''
-                                rf_data = {
-                                    'timestamp': time.time(),
-                                    'pubkey_prefix': pubkey_prefix,
-                                    'snr': snr,
-                                    'rssi': rssi,
-                                    'path_nodes': decoded['path_nodes'],
-                                    'path_length': len(decoded['path_nodes']),
-                                    'route_type': decoded.get('route_type_name', 'Unknown')
-                                }
-                                self.recent_rf_data.append(rf_data)
-                                logger.info(f"📡 Stored path: {','.join(decoded['path_nodes'])} ({len(decoded['path_nodes'])} hops)")
-
-                                # Clean up old RF data (keep only last 5 seconds)
-                                current_time = time.time()
-                                self.recent_rf_data = [d for d in self.recent_rf_data
-                                                      if current_time - d['timestamp'] < self.rf_data_timeout]
-                except Exception as e:
-                    logger.error(f"Error in on_rx_log_data: {e}", exc_info=True)
+        async def on_trace_data(event):
+            logger.info("🔍 Trace data: %s", event)
 
-            async def on_new_contact(event):
-                try:
-                    # Extract contact info from event
-                    if hasattr(event, 'payload'):
-                        payload = event.payload
-                        node_name = payload.get('name', payload.get('node_name', 'Unknown'))
-                        pubkey = payload.get('pubkey', payload.get('pubkey_prefix', ''))
-                        logger.info(f"👋 NEW CONTACT DISCOVERED: {node_name} (pubkey: {pubkey[:16]}...)")
-                    else:
-                        logger.info(f"👋 NEW CONTACT: {event}")
-                except Exception as e:
-                    logger.error(f"Error in on_new_contact: {e}", exc_info=True)
+        async def on_rx_log_data(event):
+            """Capture RSSI, SNR, and path data from RX log data."""
+            try:
+                if hasattr(event, 'payload'):
+                    payload = event.payload
 
-            async def on_messages_waiting(event):
-                try:
-                    if hasattr(event, 'payload'):
-                        payload = event.payload
-                        count = payload.get('count', payload.get('messages_available', 0))
-                        if count > 0:
-                            logger.info(f"📬 MESSAGES WAITING: {count} message(s) available")
-                    else:
-                        logger.info(f"📬 MESSAGES WAITING: {event}")
-                except Exception as e:
-                    logger.error(f"Error in on_messages_waiting: {e}", exc_info=True)
+                    # Extract SNR and RSSI
+                    snr = payload.get('snr', payload.get('SNR'))
+                    rssi = payload.get('rssi', payload.get('RSSI'))
+
+                    # Store SNR/RSSI for test/ping commands
+                    self.last_rx_snr = snr
+                    self.last_rx_rssi = rssi
+
+                    # Extract and decode packet data for path information
+                    raw_hex = payload.get('raw_hex', '')
+                    payload_hex = payload.get('payload', '')
+
+                    if raw_hex:
+                        # Decode packet to extract routing info
+                        decoded = self.packet_decoder.decode_meshcore_packet(raw_hex, payload_hex)
+
+                        logger.info("RX_LOG: decoded=%s, path_nodes=%s", bool(decoded), decoded.get('path_nodes') if decoded else None)
+
+                        if decoded and decoded.get('path_nodes'):
+                            # Store RF data for correlation with messages
+                            pubkey_prefix = raw_hex[:12] if len(raw_hex) >= 12 else ''
+                            rf_data = {
+                                'timestamp': time.time(),
+                                'pubkey_prefix': pubkey_prefix,
+                                'snr': snr,
+                                'rssi': rssi,
+                                'path_nodes': decoded['path_nodes'],
+                                'path_length': len(decoded['path_nodes']),
+                                'route_type': decoded.get('route_type_name', 'Unknown')
+                            }
+                            self.recent_rf_data.append(rf_data)
+                            logger.info("📡 Stored path: %s (%d hops)", ','.join(decoded['path_nodes']), len(decoded['path_nodes']))
+
+                            # Clean up old RF data (keep only last 5 seconds)
+                            current_time = time.time()
+                            self.recent_rf_data = [d for d in self.recent_rf_data
+                                                  if current_time - d['timestamp'] < self.rf_data_timeout]
+            except Exception as e:
+                logger.error(f"Error in on_rx_log_data: {e}", exc_info=True)
 
-            async def on_status_response(event):
-                try:
-                    if hasattr(event, 'payload'):
-                        payload = event.payload
-                        logger.info(f"📊 STATUS RESPONSE: {payload}")
-                    else:
-                        logger.info(f"📊 STATUS: {event}")
-                except Exception as e:
-                    logger.error(f"Error in on_status_response: {e}", exc_info=True)
+        async def on_new_contact(event):
+            try:
+                # Extract contact info from event
+                if hasattr(event, 'payload'):
+                    payload = event.payload
+                    node_name = payload.get('name', payload.get('node_name', 'Unknown'))
+                    pubkey = payload.get('pubkey', payload.get('pubkey_prefix', ''))
+                    logger.info(f"👋 NEW CONTACT DISCOVERED: {node_name} (pubkey: {pubkey[:16]}...)")
+                else:
+                    logger.info(f"👋 NEW CONTACT: {event}")
+            except Exception as e:
+                logger.error(f"Error in on_new_contact: {e}", exc_info=True)
+
+        async def on_messages_waiting(event):
+            try:
+                if hasattr(event, 'payload'):
+                    payload = event.payload
+                    count = payload.get('count', payload.get('messages_available', 0))
+                    if count > 0:
+                        logger.info(f"📬 MESSAGES WAITING: {count} message(s) available")
+                else:
+                    logger.info(f"📬 MESSAGES WAITING: {event}")
+                # Wake the poll loop
+                self._messages_waiting.set()
+            except Exception as e:
+                logger.error(f"Error in on_messages_waiting: {e}", exc_info=True)
 
-            # Subscribe to ALL EventTypes to see what's actually coming through
-            logger.info("Subscribing to events...")
+        async def on_status_response(event):
+            try:
+                if hasattr(event, 'payload'):
+                    payload = event.payload
+                    logger.info(f"📊 STATUS RESPONSE: {payload}")
+                else:
+                    logger.info(f"📊 STATUS: {event}")
+            except Exception as e:
+                logger.error(f"Error in on_status_response: {e}", exc_info=True)
+
+        # Subscribe to ALL EventTypes to see what's actually coming through (debug only -
+        # doubles the dispatch cost of every event)
+        logger.info("Subscribing to events...")
+        if os.getenv('MESHCORE_DEBUG_EVENTS') == '1':
             for event_type in EventType:
                 try:
                     self.meshcore.subscribe(event_type, on_any_event)
@@ -2132,230 +2423,288 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
                 except Exception as e:
                     logger.warning(f"  ✗ Could not subscribe to {event_type}: {e}")
 
-            # Also subscribe specific handlers
-            self.meshcore.subscribe(EventType.CHANNEL_MSG_RECV, on_channel_msg)
-            self.meshcore.subscribe(EventType.CONTACT_MSG_RECV, on_contact_msg)
-            self.meshcore.subscribe(EventType.NEW_CONTACT, on_new_contact)
-            self.meshcore.subscribe(EventType.MESSAGES_WAITING, on_messages_waiting)
-            self.meshcore.subscribe(EventType.STATUS_RESPONSE, on_status_response)
-            self.meshcore.subscribe(EventType.MSG_SENT, on_msg_sent)
-            self.meshcore.subscribe(EventType.ACK, on_ack)
-            self.meshcore.subscribe(EventType.RX_LOG_DATA, on_rx_log_data)
-
-            # Query device info on startup
-            logger.info("="*60)
-            logger.info("Querying device information...")
-            logger.info("="*60)
-
-            # Handlers to capture startup info
-            startup_info = {}
-
-            async def capture_self_info(event):
-                if hasattr(event, 'payload'):
-                    startup_info['self_info'] = event.payload
-                    payload = event.payload
+        # Also subscribe specific handlers
+        self.meshcore.subscribe(EventType.CHANNEL_MSG_RECV, on_channel_msg)
+        self.meshcore.subscribe(EventType.CONTACT_MSG_RECV, on_contact_msg)
+        self.meshcore.subscribe(EventType.NEW_CONTACT, on_new_contact)
+        self.meshcore.subscribe(EventType.MESSAGES_WAITING, on_messages_waiting)
+        self.meshcore.subscribe(EventType.STATUS_RESPONSE, on_status_response)
+        self.meshcore.subscribe(EventType.MSG_SENT, on_msg_sent)
+        self.meshcore.subscribe(EventType.ACK, on_ack)
+        self.meshcore.subscribe(EventType.RX_LOG_DATA, on_rx_log_data)
+
+        # Query device info on startup
+        logger.info("="*60)
+        logger.info("Querying device information...")
+        logger.info("="*60)
 
-                    # Log key self info without the full payload
-                    name = payload.get('adv_name', 'Unknown')
-                    pubkey_prefix = payload.get('public_key', '')[:8] if payload.get('public_key') else 'N/A'
-                    logger.info(f"🤖 SELF INFO: {name} ({pubkey_prefix}...)")
+        # Handlers to capture startup info
+        startup_info = {}
+
+        async def capture_self_info(event):
+            if hasattr(event, 'payload'):
+                startup_info['self_info'] = event.payload
+                payload = event.payload
+
+                # Log key self info without the full payload
+                name = payload.get('adv_name', 'Unknown')
+                pubkey_prefix = payload.get('public_key', '')[:8] if payload.get('public_key') else 'N/A'
+                logger.info(f"🤖 SELF INFO: {name} ({pubkey_prefix}...)")
+
+                # Build channel map from self info
+                self._build_channel_map(event.payload)
+
+        async def capture_device_info(event):
+            if hasattr(event, 'payload'):
+                startup_info['device_info'] = event.payload
+                payload = event.payload
+
+                # Log key device info without the full payload
+                device_type = payload.get('device_type', 'Unknown')
+                firmware = payload.get('firmware_version', 'N/A')
+                logger.info(f"📱 DEVICE INFO: {device_type} (Firmware: {firmware})")
+
+        async def capture_battery(event):
+            if hasattr(event, 'payload'):
+                payload = event.payload
+                battery_level = payload.get('level')
+
+                # Separate battery and memory info
+                battery_info = {'level': battery_level}
+                memory_info = {}
+
+                if 'used_kb' in payload:
+                    memory_info['used_kb'] = payload['used_kb']
+                if 'total_kb' in payload:
+                    memory_info['total_kb'] = payload['total_kb']
+
+                startup_info['battery'] = battery_info
+                if memory_info:
+                    startup_info['memory'] = memory_info
+
+                # Only log battery at 10% increments (90%, 80%, 70%, etc.)
+                if battery_level is not None:
+                    # Typical LiPo voltage: 4200mV (100%) to 3000mV (0%)
+                    # Convert mV to percentage
+                    MAX_VOLTAGE = 4200
+                    MIN_VOLTAGE = 3000
+                    voltage_range = MAX_VOLTAGE - MIN_VOLTAGE
+                    battery_percent = ((battery_level - MIN_VOLTAGE) / voltage_range) * 100
+                    battery_percent = max(0, min(100, battery_percent))  # Clamp to 0-100%
+
+                    # Round to nearest 10% threshold
+                    current_threshold = int(battery_percent / 10) * 10
+
+                    if self.last_battery_level is None:
+                        # First reading - always log
+                        logger.info(f"🔋 BATTERY: {battery_level} mV ({battery_percent:.0f}%)")
+                        self.last_battery_level = current_threshold
+                    else:
+                        # Log only when crossing a 10% threshold
+                        if current_threshold != self.last_battery_level:
+                            logger.info(f"🔋 BATTERY: {battery_level} mV ({battery_percent:.0f}%) - crossed {current_threshold}% threshold")
+                            self.last_battery_level = current_threshold
 
-                    # Build channel map from self info
-                    self._build_channel_map(event.payload)
+                # Only log memory if it changed
+                if memory_info:
+                    used_kb = memory_info.get('used_kb')
+                    total_kb = memory_info.get('total_kb')
+
+                    # Log only if memory values have changed
+                    if used_kb != self.last_memory_used or total_kb != self.last_memory_total:
+                        logger.info(f"💾 MEMORY: {used_kb}/{total_kb} KB used")
+                        self.last_memory_used = used_kb
+                        self.last_memory_total = total_kb
+
+        async def capture_current_time(event):
+            if hasattr(event, 'payload'):
+                startup_info['current_time'] = event.payload
+                logger.info(f"🕐 CURRENT TIME: {event.payload}")
+
+        contacts_loaded = asyncio.Event()
+
+        async def capture_contacts(event):
+            if hasattr(event, 'payload'):
+                contact_list = event.payload
+                startup_info['contacts'] = contact_list
+                contacts_loaded.set()
+
+                # Just log contact count, not the full details
+                if isinstance(contact_list, dict):
+                    logger.info(f"👥 CONTACTS: {len(contact_list)} contacts loaded")
+                elif hasattr(self.meshcore, 'contacts'):
+                    actual_contacts = self.meshcore.contacts
+                    if hasattr(actual_contacts, '__len__'):
+                        logger.info(f"👥 CONTACTS: {len(actual_contacts)} contacts loaded")
+                    else:
+                        logger.info(f"👥 CONTACTS: Loaded")
+                else:
+                    logger.info(f"👥 CONTACTS: Loaded")
+
+        async def capture_channel_info(event):
+            if hasattr(event, 'payload'):
+                channel_info = event.payload
+                startup_info['channel_info'] = channel_info
+                logger.debug(f"📡 CHANNEL_INFO received: {channel_info}")
+
+        # Subscribe to startup info events
+        self.meshcore.subscribe(EventType.SELF_INFO, capture_self_info)
+        self.meshcore.subscribe(EventType.DEVICE_INFO, capture_device_info)
+        self.meshcore.subscribe(EventType.BATTERY, capture_battery)
+        self.meshcore.subscribe(EventType.CURRENT_TIME, capture_current_time)
+        self.meshcore.subscribe(EventType.CONTACTS, capture_contacts)
+        self.meshcore.subscribe(EventType.CHANNEL_INFO, capture_channel_info)
 
-            async def capture_device_info(event):
-                if hasattr(event, 'payload'):
-                    startup_info['device_info'] = event.payload
-                    payload = event.payload
+        try:
+            # Request contacts
+            await self.meshcore.commands.get_contacts()
 
-                    # Log key device info without the full payload
-                    device_type = payload.get('device_type', 'Unknown')
-                    firmware = payload.get('firmware_version', 'N/A')
-                    logger.info(f"📱 DEVICE INFO: {device_type} (Firmware: {firmware})")
+            # Query channels directly from device using get_channel()
+            if hasattr(self.meshcore.commands, 'get_channel'):
+                channels_data = []
 
-            async def capture_battery(event):
-                if hasattr(event, 'payload'):
-                    payload = event.payload
-                    battery_level = payload.get('level')
-
-                    # Separate battery and memory info
-                    battery_info = {'level': battery_level}
-                    memory_info = {}
-
-                    if 'used_kb' in payload:
-                        memory_info['used_kb'] = payload['used_kb']
-                    if 'total_kb' in payload:
-                        memory_info['total_kb'] = payload['total_kb']
-
-                    startup_info['battery'] = battery_info
-                    if memory_info:
-                        startup_info['memory'] = memory_info
-
-                    # Only log battery at 10% increments (90%, 80%, 70%, etc.)
-                    if battery_level is not None:
-                        # Typical LiPo voltage: 4200mV (100%) to 3000mV (0%)
-                        # Convert mV to percentage
-                        MAX_VOLTAGE = 4200
-                        MIN_VOLTAGE = 3000
-                        voltage_range = MAX_VOLTAGE - MIN_VOLTAGE
-                        battery_percent = ((battery_level - MIN_VOLTAGE) / voltage_range) * 100
-                        battery_percent = max(0, min(100, battery_percent))  # Clamp to 0-100%
-
-                        # Round to nearest 10% threshold
-                        current_threshold = int(battery_percent / 10) * 10
-
-                        if self.last_battery_level is None:
-                            # First reading - always log
-                            logger.info(f"🔋 BATTERY: {battery_level} mV ({battery_percent:.0f}%)")
-                            self.last_battery_level = current_threshold
+                # Query up to 16 channels (typical max)
+                for i in range(16):
+                    try:
+                        result = await asyncio.wait_for(
+                            self.meshcore.commands.get_channel(i),
+                            timeout=2.0
+                        )
+
+                        if result.type == EventType.CHANNEL_INFO:
+                            payload = result.payload
+                            name = payload.get('channel_name') or f'Channel{i}'
+                            secret = payload.get('channel_secret', b'')
+
+                            channels_data.append({
+                                'name': name,
+                                'secret': secret.hex() if secret else ''
+                            })
                         else:
-                            # Log only when crossing a 10% threshold
-                            if current_threshold != self.last_battery_level:
-                                logger.info(f"🔋 BATTERY: {battery_level} mV ({battery_percent:.0f}%) - crossed {current_threshold}% threshold")
-                                self.last_battery_level = current_threshold
-
-                    # Only log memory if it changed
-                    if memory_info:
-                        used_kb = memory_info.get('used_kb')
-                        total_kb = memory_info.get('total_kb')
-
-                        # Log only if memory values have changed
-                        if used_kb != self.last_memory_used or total_kb != self.last_memory_total:
-                            logger.info(f"💾 MEMORY: {used_kb}/{total_kb} KB used")
-                            self.last_memory_used = used_kb
-                            self.last_memory_total = total_kb
-
-            async def capture_current_time(event):
-                if hasattr(event, 'payload'):
-                    startup_info['current_time'] = event.payload
-                    logger.info(f"🕐 CURRENT TIME: {event.payload}")
+                            # No more channels
+                            break
 
-            async def capture_contacts(event):
-                if hasattr(event, 'payload'):
-                    contact_list = event.payload
-                    startup_info['contacts'] = contact_list
-
-                    # Just log contact count, not the full details
-                    if isinstance(contact_list, dict):
-                        logger.info(f"👥 CONTACTS: {len(contact_list)} contacts loaded")
-                    elif hasattr(self.meshcore, 'contacts'):
-                        actual_contacts = self.meshcore.contacts
-                        if hasattr(actual_contacts, '__len__'):
-                            logger.info(f"👥 CONTACTS: {len(actual_contacts)} contacts loaded")
-                        else:
-                            logger.info(f"👥 CONTACTS: Loaded")
-                    else:
-                        logger.info(f"👥 CONTACTS: Loaded")
+                    except asyncio.TimeoutError:
+                        # Channel not configured or end of channels
+                        break
+                    except Exception as e:
+                        logger.debug(f"Channel {i} query failed: {e}")
+                        break
 
-            async def capture_channel_info(event):
-                if hasattr(event, 'payload'):
-                    channel_info = event.payload
-                    startup_info['channel_info'] = channel_info
-                    logger.debug(f"📡 CHANNEL_INFO received: {channel_info}")
-
-            # Subscribe to startup info events
-            self.meshcore.subscribe(EventType.SELF_INFO, capture_self_info)
-            self.meshcore.subscribe(EventType.DEVICE_INFO, capture_device_info)
-            self.meshcore.subscribe(EventType.BATTERY, capture_battery)
-            self.meshcore.subscribe(EventType.CURRENT_TIME, capture_current_time)
-            self.meshcore.subscribe(EventType.CONTACTS, capture_contacts)
-            self.meshcore.subscribe(EventType.CHANNEL_INFO, capture_channel_info)
+                if channels_data:
+                    self._build_channel_map({'channels': channels_data})
 
+            # Give the contacts event time to arrive (usually it already has by now)
             try:
-                # Request contacts
-                await self.meshcore.commands.get_contacts()
-
-                # Query channels directly from device using get_channel()
-                if hasattr(self.meshcore.commands, 'get_channel'):
-                    channels_data = []
-
-                    # Query up to 16 channels (typical max)
-                    for i in range(16):
-                        try:
-                            result = await asyncio.wait_for(
-                                self.meshcore.commands.get_channel(i),
-                                timeout=2.0
-                            )
-
-                            if result.type == EventType.CHANNEL_INFO:
-                                payload = result.payload
-                                name = payload.get('channel_name', f'Channel{i}')
-                                secret = payload.get('channel_secret', b'')
-
-                                channels_data.append({
-                                    'name': name,
-                                    'secret': secret.hex() if secret else ''
-                                })
-                            else:
-                                # No more channels
-                                break
-
-                        except asyncio.TimeoutError:
-                            # Channel not configured or end of channels
-                            break
-                        except Exception as e:
-                            logger.debug(f"Channel {i} query failed: {e}")
-                            break
-
-                    if channels_data:
-                        self._build_channel_map({'channels': channels_data})
+                await asyncio.wait_for(contacts_loaded.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                logger.debug("Contacts event not received within 1s, continuing")
 
-                # Give events time to arrive
-                await asyncio.sleep(1)
+        except Exception as e:
+            logger.warning(f"Could not query device info: {e}")
 
-            except Exception as e:
-                logger.warning(f"Could not query device info: {e}")
+        # Final fallback to config file or defaults
+        if not self.channel_map:
+            logger.warning("⚠️  Could not get channels from device, trying config file...")
+            self._build_channel_map()
 
-            # Final fallback to config file or defaults
-            if not self.channel_map:
-                logger.warning("⚠️  Could not get channels from device, trying config file...")
-                self._build_channel_map()
+        logger.info("="*60)
 
-            logger.info("="*60)
+        # Start auto message fetching - THIS IS CRITICAL!
+        logger.info("Starting auto message fetching...")
+        await self.meshcore.start_auto_message_fetching()
 
-            # Start auto message fetching - THIS IS CRITICAL!
-            logger.info("Starting auto message fetching...")
-            await self.meshcore.start_auto_message_fetching()
+        # Start scheduled broadcast background task
+        asyncio.create_task(self.scheduled_broadcast_loop())
 
-            # Start scheduled broadcast background task
-            asyncio.create_task(self.scheduled_broadcast_loop())
+        # Start Discord bot for bidirectional sync if configured
+        if self.discord_client:
+            asyncio.create_task(self._run_discord_bot())
 
-            # Start Discord bot for bidirectional sync if configured
-            if self.discord_client:
-                asyncio.create_task(self._run_discord_bot())
+        logger.info("✓ Bot is now listening for messages (Ctrl+C to stop)")
+        logger.info(f"Trigger: '{self.trigger_word}'")
+        logger.info(f"Listening: ALL channels (public + private messages)")
 
-            logger.info("✓ Bot is now listening for messages (Ctrl+C to stop)")
-            logger.info(f"Trigger: '{self.trigger_word}'")
-            logger.info(f"Listening: ALL channels (public + private messages)")
+    async def run_forever(self):
+        """Poll the device for messages until it disconnects."""
+        # Keep running and ACTIVELY POLL for messages
+        # Poll every 2s, backing off to 5s while idle (MESSAGES_WAITING may not fire, so keep it short);
+        # MESSAGES_WAITING wakes the loop early
+        logger.info("✅ Event loop running - polling for new messages (2-5s, adaptive)...")
+        min_poll_interval = 2
+        max_poll_interval = 5
+        poll_interval = min_poll_interval
 
-            # Keep running and ACTIVELY POLL for messages
-            logger.info("✅ Event loop running - polling for new messages every 2s...")
-            poll_interval = 2  # Poll every 2 seconds
+        while self.meshcore.is_connected:
+            try:
+                # Cleared before polling so a MESSAGES_WAITING during the poll isn't lost
+                self._messages_waiting.clear()
+
+                # Manually poll for messages since MESSAGES_WAITING events may not fire
+                result = await self.meshcore.commands.get_msg()
+                got_message = False
+
+                # Only log when we actually receive a message (not "no_event_received")
+                rtype = result.type if result else None
+                if rtype == EventType.NO_MORE_MSGS:
+                    # Don't spam logs with NO_MORE_MSGS events
+                    logger.debug("📬 Poll: %s", rtype)
+                elif rtype == EventType.ERROR:
+                    error_reason = result.payload.get('reason', '')
+                    if error_reason != 'no_event_received':
+                        # Log unexpected errors
+                        logger.warning(f"⚠️  Poll error: {error_reason}")
+                elif rtype is not None:
+                    logger.info("📬 NEW MESSAGE: %s - %s", rtype, result)
+                    got_message = True
+
+                # Back off while idle, go back to fast polling as soon as something arrives
+                if got_message:
+                    poll_interval = min_poll_interval
+                else:
+                    poll_interval = min(max_poll_interval, poll_interval * 1.5)
 
-            while self.meshcore.is_connected:
+                # Sleep between polls, waking early if the device reports waiting messages
                 try:
-                    # Manually poll for messages since MESSAGES_WAITING events may not fire
-                    result = await self.meshcore.commands.get_msg()
-
-                    # Only log when we actually receive a message (not "no_event_received")
-                    if result and result.type != EventType.ERROR:
-                        # Don't spam logs with NO_MORE_MSGS events
-                        if result.type == EventType.NO_MORE_MSGS:
-                            logger.debug(f"📬 Poll: {result.type}")
-                        else:
-                            logger.info(f"📬 NEW MESSAGE: {result.type} - {result}")
-                    elif result and result.type == EventType.ERROR:
-                        error_reason = result.payload.get('reason', '')
-                        if error_reason != 'no_event_received':
-                            # Log unexpected errors
-                            logger.warning(f"⚠️  Poll error: {error_reason}")
+                    await asyncio.wait_for(self._messages_waiting.wait(), timeout=poll_interval)
+                    poll_interval = min_poll_interval
+                except asyncio.TimeoutError:
+                    pass
 
-                    # Sleep between polls
-                    await asyncio.sleep(poll_interval)
+            except Exception as e:
+                logger.error(f"❌ Error polling for messages: {e}", exc_info=True)
+                await asyncio.sleep(poll_interval)
+
+    async def stop(self):
+        """Disconnect from the MeshCore device and Discord."""
+        # Stop message workers
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks = []
+
+        # Clean up MeshCore connection
+        if self.meshcore:
+            await self.meshcore.disconnect()
+            logger.info("Disconnected from MeshCore device")
+
+        # Close the map API and Discord webhook HTTP sessions
+        await self.api.close()
+        if self._webhook_session and not self._webhook_session.closed:
+            await self._webhook_session.close()
+
+        # Clean up Discord bot connection
+        if self.discord_client and not self.discord_client.is_closed():
+            try:
+                await self.discord_client.close()
+                logger.info("Disconnected from Discord")
+            except Exception as e:
+                logger.warning(f"Error closing Discord connection: {e}")
 
-                except Exception as e:
-                    logger.error(f"❌ Error polling for messages: {e}", exc_info=True)
-                    await asyncio.sleep(poll_interval)
+    async def run(self):
+        """Main bot loop - connect and listen for messages."""
+        try:
+            await self.start()
+            await self.run_forever()
 
         except KeyboardInterrupt:
             logger.info("\nShutting down bot...")
@@ -2363,18 +2712,7 @@ Use Australian/NZ spelling and casual but technical tone with confidence. ALWAYS
             logger.error(f"Fatal error: {e}", exc_info=True)
             raise
         finally:
-            # Clean up MeshCore connection
-            if self.meshcore:
-                await self.meshcore.disconnect()
-                logger.info("Disconnected from MeshCore device")
-
-            # Clean up Discord bot connection
-            if self.discord_client and not self.discord_client.is_closed():
-                try:
-                    await self.discord_client.close()
-                    logger.info("Disconnected from Discord")
-                except Exception as e:
-                    logger.warning(f"Error closing Discord connection: {e}")
+            await self.stop()
 
 
 async def main():
@@ -1,6 +1,7 @@
 """Configuration management for MeshCore bot."""
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -61,3 +62,9 @@ class Settings:
             api_host=os.getenv('API_HOST', 'localhost'),
             api_port=int(os.getenv('API_PORT', '8080'))
         )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once and reuse them."""
+    return Settings.from_env()
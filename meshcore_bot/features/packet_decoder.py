@@ -9,6 +9,9 @@ from .enums import RouteType, PayloadType, PayloadVersion
 
 logger = logging.getLogger(__name__)
 
+# Two-char lower-case hex for every byte value, so path hops are a table lookup
+_HEX_BYTE = tuple(f"{i:02x}" for i in range(256))
+
 
 class PacketDecoder:
     """Decodes MeshCore packets to extract routing path information"""
@@ -91,11 +94,7 @@ class PacketDecoder:
 
             # Convert path to list of hex values
             path_hex = path_bytes.hex()
-            path_values = []
-            i = 0
-            while i < len(path_hex):
-                path_values.append(path_hex[i:i+2])
-                i += 2
+            path_values = [_HEX_BYTE[b] for b in path_bytes]
 
             # Process path based on packet type
             path_info = self._process_packet_path(
@@ -163,7 +162,7 @@ class PacketDecoder:
         """
         try:
             # Convert path bytes to hex node IDs
-            path_nodes = [f"{b:02x}" for b in path_bytes]
+            path_nodes = [_HEX_BYTE[b] for b in path_bytes]
 
             # Special handling for TRACE packets
             if payload_type == PayloadType.TRACE:
@@ -207,7 +206,7 @@ class PacketDecoder:
         except Exception as e:
             logger.error(f"Error processing packet path: {e}")
             # Return basic path info as fallback
-            path_nodes = [f"{b:02x}" for b in path_bytes]
+            path_nodes = [_HEX_BYTE[b] for b in path_bytes]
             return {
                 'type': 'unknown',
                 'path': path_nodes,
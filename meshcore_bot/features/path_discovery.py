@@ -183,7 +183,7 @@ class PathDiscovery:
             elif response.type == EventType.ERROR:
                 error_msg = response.payload.get('message', 'Unknown error')
                 logger.error(f"❌ Path discovery failed: {error_msg}")
-                print(f"DEBUG: Got ERROR response, payload={response.payload}")
+                logger.debug(f"Path discovery ERROR payload: {response.payload}")
                 return {
                     'success': False,
                     'error': error_msg,
@@ -208,11 +208,7 @@ class PathDiscovery:
             }
 
         except Exception as e:
-            logger.error(f"❌ Path discovery error: {e}", exc_info=True)
-            print(f"DEBUG: Exception type: {type(e)}")
-            print(f"DEBUG: Exception: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"❌ Path discovery error ({type(e).__name__}): {e}", exc_info=True)
             return {
                 'success': False,
                 'error': str(e),
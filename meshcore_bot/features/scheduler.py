@@ -8,6 +8,24 @@ logger = logging.getLogger('meshcore.bot')
 chat_logger = logging.getLogger('meshcore.chat')
 
 
+def next_broadcast_time(now: datetime, broadcast_hours: List[int]) -> datetime:
+    """
+    Get the next broadcast instant strictly after now.
+
+    Args:
+        now: Current local time
+        broadcast_hours: Hours of the day to broadcast at
+
+    Returns:
+        Start of the next broadcast hour (tomorrow's first one if none are left today)
+    """
+    today = [now.replace(hour=h, minute=0, second=0, microsecond=0) for h in sorted(broadcast_hours)]
+    for target in today:
+        if target > now:
+            return target
+    return today[0] + timedelta(days=1)
+
+
 class BroadcastScheduler:
     """Handles scheduled status broadcasts to MeshCore channels."""
 
@@ -112,22 +130,18 @@ class BroadcastScheduler:
 
         while self._running:
             try:
-                now = datetime.now()
-                current_hour = now.hour
-
-                # Check if we're at a broadcast hour
-                if current_hour in self.broadcast_hours:
-                    # Check if we're within the first 2 minutes of the hour (more tolerant window)
-                    if now.minute < 2:
-                        await self.broadcast_status()
-                        # Sleep until the next hour to avoid duplicate broadcasts
-                        # Calculate seconds until next hour
-                        seconds_until_next_hour = 3600 - (now.minute * 60 + now.second)
-                        await asyncio.sleep(seconds_until_next_hour)
-                        continue
-
-                # Sleep for 30 seconds before checking again
-                await asyncio.sleep(30)
+                # Sleep towards the next broadcast hour in chunks of at most 5 minutes,
+                # re-reading the wall clock after each one so DST changes and clock steps
+                # are picked up
+                target = next_broadcast_time(datetime.now(), self.broadcast_hours)
+                while (delay := (target - datetime.now()).total_seconds()) > 0:
+                    await asyncio.sleep(min(delay, 300))
+                    now = datetime.now()
+                    if now < target:
+                        target = next_broadcast_time(now, self.broadcast_hours)
+
+                if self._running:
+                    await self.broadcast_status()
 
             except Exception as e:
                 logger.error(f"❌ Error in scheduled broadcast loop: {e}", exc_info=True)
@@ -3,10 +3,16 @@ import logging
 from typing import Optional
 from aiohttp import web
 import json
+from ..utils import fast_json
 
 logger = logging.getLogger('meshcore.bot')
 
 
+def _json_response(data, status: int = 200) -> web.Response:
+    """Build a JSON response using the fastest available encoder."""
+    return web.json_response(data, status=status, dumps=fast_json.dumps)
+
+
 class CommandAPI:
     """HTTP API for sending commands to the bot without interrupting it."""
 
@@ -38,12 +44,12 @@ class CommandAPI:
         Body: {"message": "text", "channel": 7}
         """
         try:
-            data = await request.json()
+            data = await request.json(loads=fast_json.loads)
             message = data.get('message')
             channel = data.get('channel', 7)  # Default to #jeff
 
             if not message:
-                return web.json_response(
+                return _json_response(
                     {'status': 'error', 'message': 'Message is required'},
                     status=400
                 )
@@ -53,20 +59,20 @@ class CommandAPI:
             # Send via bot's send_message method
             await self.bot.send_message(message, channel)
 
-            return web.json_response({
+            return _json_response({
                 'status': 'ok',
                 'message': message,
                 'channel': channel
             })
 
         except json.JSONDecodeError:
-            return web.json_response(
+            return _json_response(
                 {'status': 'error', 'message': 'Invalid JSON'},
                 status=400
             )
         except Exception as e:
             logger.error(f"API send error: {e}", exc_info=True)
-            return web.json_response(
+            return _json_response(
                 {'status': 'error', 'message': str(e)},
                 status=500
             )
@@ -77,7 +83,7 @@ class CommandAPI:
 
         GET /status
         """
-        return web.json_response({
+        return _json_response({
             'status': 'ok',
             'bot_name': self.bot.bot_name,
             'connected': self.bot.meshcore is not None and self.bot.meshcore.is_connected,
@@ -90,7 +96,7 @@ class CommandAPI:
 
         GET /health
         """
-        return web.json_response({'status': 'healthy'})
+        return _json_response({'status': 'healthy'})
 
     async def start(self):
         """Start the API server."""
@@ -16,8 +16,9 @@ class LLMClient:
         model_id: str,
         aws_region: str = 'us-east-1',
         aws_profile: Optional[str] = None,
-        max_tokens: int = 100,
-        temperature: float = 0.5
+        max_tokens: int = 90,
+        temperature: float = 0.5,
+        max_pool_connections: int = 50
     ):
         """
         Initialize LLM client.
@@ -26,14 +27,16 @@ class LLMClient:
             model_id: Bedrock model ID (e.g., 'us.anthropic.claude-3-5-haiku-20241022-v1:0')
             aws_region: AWS region for Bedrock
             aws_profile: Optional AWS profile name
-            max_tokens: Maximum tokens per response (default: 100 for LoRa bandwidth)
+            max_tokens: Maximum tokens per response (default: 90, ~280 chars for LoRa)
             temperature: Sampling temperature (default: 0.5 for concise responses)
+            max_pool_connections: Max pooled HTTPS connections to Bedrock (default: 50)
         """
         self.model_id = model_id
         self.aws_region = aws_region
         self.aws_profile = aws_profile
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.max_pool_connections = max_pool_connections
         self.bedrock = self._init_bedrock_client()
         self.system_prompt = self._build_system_prompt()
 
@@ -41,7 +44,11 @@ class LLMClient:
         """Initialize AWS Bedrock client with optional profile."""
         config = Config(
             region_name=self.aws_region,
-            retries={'max_attempts': 3}
+            retries={'max_attempts': 3, 'mode': 'adaptive'},  # Client-side rate limiting + jittered backoff on throttling
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=True,  # Keep idle connections alive between sparse mesh messages
+            connect_timeout=5,
+            read_timeout=30
         )
 
         if self.aws_profile:
@@ -1,5 +1,6 @@
 """MeshCore Map API client with regional filtering and caching."""
 import logging
+import time
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta, timezone
 import requests
@@ -50,8 +51,7 @@ class MeshCoreAPI:
         if self._cache is None or self._cache_time is None:
             return False
 
-        from time import time
-        return (time() - self._cache_time) < self.cache_ttl
+        return (time.monotonic() - self._cache_time) < self.cache_ttl
 
     def _is_sydney_node(self, node: Dict) -> bool:
         """Check if a node is in Greater Sydney region."""
@@ -98,9 +98,8 @@ class MeshCoreAPI:
             response = requests.get(f"{self.base_url}/nodes", timeout=10)
             response.raise_for_status()
 
-            from time import time
             self._cache = response.json()
-            self._cache_time = time()
+            self._cache_time = time.monotonic()
 
             # Pre-filter Sydney and NSW nodes for faster lookups
             self._sydney_cache = [n for n in self._cache if self._is_sydney_node(n)]
@@ -0,0 +1,28 @@
+"""JSON helpers that use orjson when installed and fall back to the stdlib."""
+import json
+from typing import Any, Union
+
+# orjson is optional - a lot faster for encode/decode, but not required
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string (int dict keys are allowed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON from str or bytes.
+
+    Raises json.JSONDecodeError on invalid input (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)